@@ -23,6 +23,7 @@ The agent's behavior and logging level can be configured via command-line argume
 import argparse
 import logging
 from logging.handlers import RotatingFileHandler
+import signal
 import time
 import sys
 from sethlans_worker_agent import job_processor, system_monitor, config
@@ -71,19 +72,32 @@ root_logger.addHandler(file_handler)
 logger = logging.getLogger(__name__)
 
 
+def _handle_sigterm(signum, frame):
+    """
+    Routes SIGTERM through the same shutdown path as Ctrl+C, so a supervisor's
+    terminate request logs the shutdown instead of ending the process abruptly.
+    """
+    raise KeyboardInterrupt
+
+
 # --- Main Application Logic ---
 def main():
     """
     The main operational loop for the worker agent.
 
     This function continuously attempts to register with the manager and, once
-    successful, enters a loop to send heartbeats and poll for new jobs. The loop
-    is designed to be resilient to temporary network failures and handles graceful
-    shutdowns via a KeyboardInterrupt.
+    successful, enters a loop to send heartbeats and poll for new jobs. While the
+    worker is idle and claims nothing, the polling interval doubles up to
+    MAX_JOB_POLLING_INTERVAL_SECONDS. It stays at the base interval while a job
+    is running, so the next queued job is picked up promptly once resources
+    free up.
+    The loop is designed to be resilient to temporary network failures and
+    handles graceful shutdowns via a KeyboardInterrupt.
     """
     logger.info("Sethlans Reborn Worker Agent Starting...")
 
     worker_id = None
+    poll_interval = config.JOB_POLLING_INTERVAL_SECONDS
 
     while True:
         try:
@@ -99,11 +113,17 @@ def main():
 
             # If registered, perform regular heartbeat and check for jobs.
             system_monitor.send_heartbeat()
-            job_processor.get_and_claim_job(worker_id)
+            claimed_job = job_processor.get_and_claim_job(worker_id)
+            # A claim skipped because this worker is busy must not back off the poll.
+            is_idle = not claimed_job and not job_processor.has_active_jobs()
+            if not is_idle:
+                poll_interval = config.JOB_POLLING_INTERVAL_SECONDS
 
             # --- RESTORED: Always sleep after a work cycle ---
-            logger.debug(f"Loop finished. Sleeping for {config.JOB_POLLING_INTERVAL_SECONDS} seconds.")
-            time.sleep(config.JOB_POLLING_INTERVAL_SECONDS)
+            logger.debug(f"Loop finished. Sleeping for {poll_interval} seconds.")
+            time.sleep(poll_interval)
+            if is_idle:
+                poll_interval = min(poll_interval * 2, config.MAX_JOB_POLLING_INTERVAL_SECONDS)
 
         except KeyboardInterrupt:
             logger.info("Shutdown signal received. Exiting...")
@@ -115,4 +135,5 @@ def main():
 
 
 if __name__ == '__main__':
+    signal.signal(signal.SIGTERM, _handle_sigterm)
     main()
\ No newline at end of file
@@ -20,11 +20,36 @@ import os
 from typing import Optional, Dict, Any, List
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from sethlans_worker_agent import config
 
 logger = logging.getLogger(__name__)
 
+_session = None
+
+
+def _get_session() -> requests.Session:
+    """
+    Returns the shared HTTP session used for manager API calls, creating it on first use.
+
+    Reusing one pooled session keeps the connection to the manager alive
+    between polls and status updates instead of reconnecting for every
+    request. Failed connection attempts are retried with a short backoff.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        _session.mount('http://', adapter)
+        _session.mount('https://', adapter)
+    return _session
+
 
 def poll_for_available_jobs(params: Dict[str, str]) -> Optional[List[Dict[str, Any]]]:
     """
@@ -41,7 +66,7 @@ def poll_for_available_jobs(params: Dict[str, str]) -> Optional[List[Dict[str, A
     poll_url = f"{config.MANAGER_API_URL}jobs/"
     logger.debug(f"Polling for jobs with params: {params}")
     try:
-        response = requests.get(poll_url, params=params, timeout=10)
+        response = _get_session().get(poll_url, params=params, timeout=10)
         response.raise_for_status()
         available_jobs = response.json()
         if available_jobs:
@@ -51,13 +76,18 @@ def poll_for_available_jobs(params: Dict[str, str]) -> Optional[List[Dict[str, A
     return None
 
 
-def claim_job(job_id: int, worker_id: int) -> bool:
+def claim_job(job_id: int, worker_id: int, started_at: Optional[str] = None) -> bool:
     """
     Attempts to claim a specific job for this worker via a PATCH request.
 
+    If `started_at` is given, the same request also moves the job to
+    'RENDERING', so claiming and starting a job costs a single round trip.
+
     Args:
         job_id (int): The ID of the job to claim.
         worker_id (int): The ID of the worker attempting the claim.
+        started_at (str, optional): An ISO 8601 UTC timestamp to record as the
+            job's start time.
 
     Returns:
         True if the job was successfully claimed (HTTP 200).
@@ -65,8 +95,11 @@ def claim_job(job_id: int, worker_id: int) -> bool:
         False for any other error.
     """
     claim_url = f"{config.MANAGER_API_URL}jobs/{job_id}/"
+    payload = {"assigned_worker": worker_id}
+    if started_at is not None:
+        payload.update(status="RENDERING", started_at=started_at)
     try:
-        claim_response = requests.patch(claim_url, json={"assigned_worker": worker_id}, timeout=5)
+        claim_response = _get_session().patch(claim_url, json=payload, timeout=5)
 
         if claim_response.status_code == 200:
             return True
@@ -81,6 +114,46 @@ def claim_job(job_id: int, worker_id: int) -> bool:
     return False
 
 
+def fetch_job(job_id: int) -> requests.Response:
+    """
+    Fetches a job's current record from the manager over the shared session.
+
+    Unlike the other helpers, errors are left to the caller, which also needs
+    the raw response to read status codes and headers.
+
+    Args:
+        job_id (int): The ID of the job to fetch.
+
+    Returns:
+        requests.Response: The manager's response.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    return _get_session().get(f"{config.MANAGER_API_URL}jobs/{job_id}/", timeout=5)
+
+
+def post_heartbeat(payload: Dict[str, Any], timeout: int = 5) -> requests.Response:
+    """
+    Sends a heartbeat (or the initial registration) to the manager over the shared session.
+
+    Errors are left to the caller, which decides how to report a failed
+    registration or heartbeat.
+
+    Args:
+        payload (dict): The heartbeat payload, either the full system information
+            for registration or just the hostname.
+        timeout (int): The request timeout in seconds.
+
+    Returns:
+        requests.Response: The manager's response.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    return _get_session().post(f"{config.MANAGER_API_URL}heartbeat/", json=payload, timeout=timeout)
+
+
 def update_job_status(job_id: int, payload: Dict[str, Any]):
     """
     Sends a PATCH request to the manager to update a job's status or other data.
@@ -91,7 +164,7 @@ def update_job_status(job_id: int, payload: Dict[str, Any]):
     """
     update_url = f"{config.MANAGER_API_URL}jobs/{job_id}/"
     try:
-        response = requests.patch(update_url, json=payload, timeout=5)
+        response = _get_session().patch(update_url, json=payload, timeout=5)
         response.raise_for_status()
         logger.debug(f"Successfully sent status update for job {job_id}. Payload: {payload}")
     except requests.exceptions.RequestException as e:
@@ -119,7 +192,7 @@ def upload_render_output(job_id: int, output_file_path: str) -> bool:
     try:
         with open(output_file_path, 'rb') as f:
             files = {'output_file': (os.path.basename(output_file_path), f, 'image/png')}
-            response = requests.post(upload_url, files=files, timeout=60)
+            response = _get_session().post(upload_url, files=files, timeout=60)
             response.raise_for_status()
         logger.info(f"Successfully uploaded output file for job {job_id}.")
         return True
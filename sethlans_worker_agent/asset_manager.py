@@ -73,6 +73,10 @@ def ensure_asset_is_available(asset_data):
     try:
         # We can reuse the download_file utility. We'll download it to its final parent directory.
         downloaded_file_path = file_operations.download_file(file_url, str(local_path.parent))
+        if downloaded_file_path is None:
+            # download_file has already removed the incomplete file.
+            logger.error(f"Downloaded asset from {file_url} did not match the expected size. Discarded it.")
+            return None
 
         # download_file returns the full path, which should match our calculated local_path
         if downloaded_file_path == str(local_path):
@@ -12,24 +12,44 @@ This module is responsible for generating configuration scripts, constructing th
 full command-line arguments, executing the Blender subprocess, and monitoring
 its execution until completion.
 """
+import collections
 import datetime
 import logging
 import os
 import platform
+import re
+import select
 import subprocess
 import tempfile
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import psutil
 import requests
 
-from sethlans_worker_agent import config, asset_manager, system_monitor
+from sethlans_worker_agent import config, api_handler, asset_manager, system_monitor
 from sethlans_worker_agent.tool_manager import tool_manager_instance
 
 logger = logging.getLogger(__name__)
 
+# Size of each bulk read from Blender's stdout/stderr pipes.
+STREAM_READ_SIZE = 64 * 1024
+# Only the tail of Blender's stderr is kept; it is logged and used for error details.
+STDERR_TAIL_BYTES = 64 * 1024
+# How often a running job is checked for cancellation by the manager. The interval
+# doubles after each check up to the maximum, so long renders generate little API
+# traffic while short ones still react quickly. Process exit is detected separately.
+CANCEL_CHECK_INTERVAL_SECONDS = 2
+MAX_CANCEL_CHECK_INTERVAL_SECONDS = 16
+# How long a canceled job waits for its killed process tree to be reaped.
+KILL_WAIT_TIMEOUT_SECONDS = 5
+# A run of '#' characters in an output pattern, which Blender fills with the zero-padded frame number.
+_FRAME_PADDING_RE = re.compile(r'#+')
+# Win32 constants used by _pid_alive.
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_STILL_ACTIVE = 259
+
 
 def generate_render_config_script(job_id, render_engine, render_device, render_settings,
                                   gpu_index_override: Optional[int] = None, is_cpu_fallback: bool = False):
@@ -75,8 +95,7 @@ def generate_render_config_script(job_id, render_engine, render_device, render_s
         if use_gpu:
             logger.info(f"[Job {job_id}] Configuring job for GPU rendering. Available backends: {detected_gpus}")
             script_lines.append("prefs = bpy.context.preferences.addons['cycles'].preferences")
-            backend_preference = ['OPTIX', 'CUDA', 'HIP', 'METAL', 'ONEAPI']
-            chosen_backend = next((b for b in backend_preference if b in detected_gpus), None)
+            chosen_backend = next((b for b in system_monitor.GPU_BACKEND_PREFERENCE if b in detected_gpus), None)
 
             if chosen_backend:
                 script_lines.append(f"prefs.compute_device_type = '{chosen_backend}'")
@@ -132,16 +151,172 @@ def generate_render_config_script(job_id, render_engine, render_device, render_s
     return "\n".join(script_lines)
 
 
-def _stream_reader(stream, output_list):
+def _stream_reader(stream, output_list, max_bytes=None):
     """
-    Helper function to read a subprocess stream line by line into a list.
+    Helper function to drain a binary subprocess stream into a list of lines.
     This runs in a separate thread to prevent I/O deadlocks.
+
+    The pipe is drained with large `read1` calls instead of one `readline`
+    per line, which keeps up with Blender's verbose progress output. The data
+    is decoded and split once the stream closes, with newlines normalised as
+    in text mode.
+
+    Args:
+        stream: The binary pipe to drain.
+        output_list (list): The list the decoded lines are appended to.
+        max_bytes (int, optional): If set, only the last `max_bytes` of output
+            are kept, minus any partial line at the start.
     """
+    chunks = collections.deque()
+    kept_bytes = 0
+    # The last byte before the kept data, if anything was discarded.
+    preceding = b""
     try:
-        for line in iter(stream.readline, ''):
-            output_list.append(line)
+        while chunk := stream.read1(STREAM_READ_SIZE):
+            chunks.append(chunk)
+            kept_bytes += len(chunk)
+            while max_bytes is not None and kept_bytes - len(chunks[0]) >= max_bytes:
+                dropped = chunks.popleft()
+                kept_bytes -= len(dropped)
+                preceding = dropped[-1:]
     finally:
         stream.close()
+    data = b"".join(chunks)
+    if max_bytes is not None and len(data) > max_bytes:
+        preceding = data[-max_bytes - 1:-max_bytes]
+        data = data[-max_bytes:]
+    if preceding and preceding != b"\n":
+        # Drop the line that was cut off at the start of the kept tail.
+        data = data[data.find(b"\n") + 1:]
+    text = data.decode('utf-8', 'surrogateescape')
+    output_list.extend(text.replace('\r\n', '\n').replace('\r', '\n').splitlines(keepends=True))
+
+
+def _frame_output_path(output_pattern, frame):
+    """
+    Resolves the file Blender writes for one frame of an output pattern.
+
+    As in Blender, the last run of '#' characters is replaced by the frame
+    number zero-padded to the run's length. A pattern without '#' gets a
+    4-digit frame number appended.
+
+    Args:
+        output_pattern (str): The `-o` output pattern, without an extension.
+        frame (int): The rendered frame number.
+
+    Returns:
+        str: The path of the rendered PNG file.
+    """
+    runs = list(_FRAME_PADDING_RE.finditer(output_pattern))
+    if not runs:
+        return f"{output_pattern}{frame:04d}.png"
+    last = runs[-1]
+    return f"{output_pattern[:last.start()]}{frame:0{len(last.group())}d}{output_pattern[last.end():]}.png"
+
+
+def _pid_alive(pid):
+    """
+    Checks whether a process with the given PID is still running.
+
+    This is a single system call, unlike `psutil.pid_exists`, which scans
+    every PID on Windows. `os.kill` cannot be used on Windows because there
+    it terminates the process.
+
+    Args:
+        pid (int): The process ID.
+
+    Returns:
+        bool: True if the process exists, False otherwise.
+    """
+    if platform.system() == "Windows":
+        import ctypes
+        from ctypes import wintypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = wintypes.DWORD()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return True
+            return exit_code.value == _STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user.
+        return True
+    return True
+
+
+def _kill_process_tree(pid, timeout=KILL_WAIT_TIMEOUT_SECONDS):
+    """
+    Kills a process and all of its descendants, children first.
+
+    Blender can spawn helper processes (e.g. denoisers) that would otherwise
+    be orphaned and keep holding GPU memory and file locks. Processes that
+    exit on their own in the meantime are ignored.
+
+    Args:
+        pid (int): The process ID at the root of the tree.
+        timeout (float): Seconds to wait for the killed processes to be reaped.
+    """
+    parent = psutil.Process(pid)
+    procs = parent.children(recursive=True) + [parent]
+    for proc in procs:
+        try:
+            proc.kill()
+        except psutil.NoSuchProcess:
+            pass
+    psutil.wait_procs(procs, timeout=timeout)
+
+
+def _open_pidfd(pid):
+    """
+    Opens a pidfd for a process so its exit can be waited on with select.
+
+    Args:
+        pid (int): The process ID.
+
+    Returns:
+        int or None: The file descriptor, or None if pidfds are unavailable
+                     (non-Linux platforms, or kernels older than 5.3).
+    """
+    if not hasattr(os, 'pidfd_open'):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def _wait_for_exit(process, timeout, pidfd=None):
+    """
+    Blocks until the process exits or the timeout elapses.
+
+    With a pidfd the kernel wakes the caller as soon as the process exits, so
+    a finished render is noticed immediately and an idle wait costs no CPU.
+    Without one, Popen.wait's own timeout handling is used.
+
+    Args:
+        process (subprocess.Popen): The process to wait for.
+        timeout (float): The maximum number of seconds to wait.
+        pidfd (int, optional): A pidfd from `_open_pidfd` for the process.
+    """
+    if pidfd is not None:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        poller.poll(timeout * 1000)
+        return
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        pass
 
 
 def execute_blender_job(job_data, assigned_gpu_index: Optional[int] = None):
@@ -197,11 +372,16 @@ def execute_blender_job(job_data, assigned_gpu_index: Optional[int] = None):
 
     os.makedirs(config.WORKER_TEMP_DIR, exist_ok=True)
 
-    local_blend_file_path = asset_manager.ensure_asset_is_available(job_data.get('asset'))
+    # The asset and the Blender install are independent downloads, so fetch them side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        asset_future = executor.submit(asset_manager.ensure_asset_is_available, job_data.get('asset'))
+        blender_future = executor.submit(tool_manager_instance.ensure_blender_version_available, blender_version_req)
+
+    local_blend_file_path = asset_future.result()
     if not local_blend_file_path:
         return False, False, "", "", "Failed to download or find the required .blend file asset.", None
 
-    blender_to_use = tool_manager_instance.ensure_blender_version_available(blender_version_req)
+    blender_to_use = blender_future.result()
     if not blender_to_use:
         return False, False, "", "", f"Could not find or acquire Blender version '{blender_version_req}'. Aborting job.", None
 
@@ -276,41 +456,43 @@ def execute_blender_job(job_data, assigned_gpu_index: Optional[int] = None):
 
     logger.info(f"Running Command: {' '.join(command)}")
     process = None
+    pidfd = None
     was_canceled, stdout_lines, stderr_lines, error_message = False, [], [], ""
     final_return_code = -1
 
     try:
-        popen_kwargs = {"stdout": subprocess.PIPE, "stderr": subprocess.PIPE, "encoding": 'utf-8',
-                        "errors": 'surrogateescape', "cwd": config.PROJECT_ROOT_FOR_WORKER}
+        # Pipes are binary; _stream_reader decodes them in bulk.
+        popen_kwargs = {"stdout": subprocess.PIPE, "stderr": subprocess.PIPE,
+                        "cwd": config.PROJECT_ROOT_FOR_WORKER}
         if platform.system() == "Windows":
             popen_kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
 
         logger.info(f"[Job {job_id}] Blender subprocess starting at {datetime.datetime.now(datetime.timezone.utc).isoformat()}...")
         process = subprocess.Popen(command, **popen_kwargs)
         logger.info(f"Blender subprocess launched with PID: {process.pid}")
+        pidfd = _open_pidfd(process.pid)
 
         stdout_thread = threading.Thread(target=_stream_reader, args=(process.stdout, stdout_lines))
-        stderr_thread = threading.Thread(target=_stream_reader, args=(process.stderr, stderr_lines))
+        stderr_thread = threading.Thread(target=_stream_reader, args=(process.stderr, stderr_lines, STDERR_TAIL_BYTES))
         stdout_thread.start()
         stderr_thread.start()
-        job_url = f"{config.MANAGER_API_URL}jobs/{job_id}/"
+        cancel_check_interval = CANCEL_CHECK_INTERVAL_SECONDS
 
         while process.poll() is None:
             logger.debug(f"Polling subprocess... still running. Checking for cancellation signal.")
             try:
-                response = requests.get(job_url, timeout=5)
+                response = api_handler.fetch_job(job_id)
                 if response.status_code == 200 and response.json().get('status') == 'CANCELED':
                     logger.warning(f"Cancellation signal for job ID {job_id} received. Terminating process tree.")
-                    parent = psutil.Process(process.pid)
-                    for child in parent.children(recursive=True):
-                        child.kill()
-                    parent.kill()
+                    _kill_process_tree(process.pid)
                     was_canceled = True
                     break
             except (requests.exceptions.RequestException, psutil.NoSuchProcess):
-                if not psutil.pid_exists(process.pid):
+                if not _pid_alive(process.pid):
                     break
-            time.sleep(2)
+            # The status request only runs once per interval; process exit still ends the wait immediately.
+            _wait_for_exit(process, cancel_check_interval, pidfd)
+            cancel_check_interval = min(cancel_check_interval * 2, MAX_CANCEL_CHECK_INTERVAL_SECONDS)
 
         stdout_thread.join()
         stderr_thread.join()
@@ -324,6 +506,8 @@ def execute_blender_job(job_data, assigned_gpu_index: Optional[int] = None):
         logger.critical(error_message, exc_info=True)
         final_return_code = -1
     finally:
+        if pidfd is not None:
+            os.close(pidfd)
         if temp_script_path and os.path.exists(temp_script_path):
             os.remove(temp_script_path)
 
@@ -347,9 +531,10 @@ def execute_blender_job(job_data, assigned_gpu_index: Optional[int] = None):
         logger.info("Render command completed successfully.")
         success = True
         if start_frame == end_frame:
-            final_output_path = resolved_output_pattern.replace("####", f"{start_frame:04d}") + ".png"
+            final_output_path = _frame_output_path(resolved_output_pattern, start_frame)
     elif not error_message:
-        error_details = stderr_output.strip()[:500] if stderr_output.strip() else "No STDERR output."
+        # Blender prints the fatal error last, so keep the end of the output.
+        error_details = stderr_output.strip()[-500:] if stderr_output.strip() else "No STDERR output."
         error_message = f"Blender exited with code {final_return_code}. Details: {error_details}"
 
     logger.info(f"[Job {job_id}] Job execution finished at {datetime.datetime.now(datetime.timezone.utc).isoformat()}.")
@@ -28,6 +28,23 @@ if config_file_path.exists():
     config_parser.read(config_file_path)
 
 
+def _build_ini_cache(parser):
+    """
+    Copies the raw .ini contents into plain dicts, so lookups skip ConfigParser's
+    option normalisation on every call.
+
+    Values are stored uninterpolated; interpolating every option up front would
+    make a stray '%' in any unread option stop the worker from starting.
+    """
+    return {section: dict(parser.items(section, raw=True)) for section in parser.sections()}
+
+
+_INI_CACHE = _build_ini_cache(config_parser)
+
+# Environment variable names by (section, key), filled on first lookup.
+_ENV_KEYS = {}
+
+
 # --- Helper function to get config value with override ---
 def get_config_value(section, key, default, is_int=False):
     """
@@ -36,15 +53,20 @@ def get_config_value(section, key, default, is_int=False):
     2. Checks .ini file.
     3. Falls back to the hardcoded default.
     """
-    env_var_name = f"SETHLANS_{section.upper()}_{key.upper()}"
+    env_var_name = _ENV_KEYS.get((section, key))
+    if env_var_name is None:
+        env_var_name = _ENV_KEYS[(section, key)] = f"SETHLANS_{section.upper()}_{key.upper()}"
     value = os.getenv(env_var_name)
     if value is not None:
         return int(value) if is_int else value
 
-    if config_parser.has_option(section, key):
-        if is_int:
-            return config_parser.getint(section, key)
-        return config_parser.get(section, key)
+    # ConfigParser stores option names lowercased.
+    value = _INI_CACHE.get(section, {}).get(key.lower())
+    if value is not None:
+        if '%' in value:
+            # Only interpolate options that are actually read.
+            value = config_parser.get(section, key)
+        return int(value) if is_int else value
 
     return int(default) if is_int else default
 
@@ -59,6 +81,8 @@ MANAGER_API_URL = f"http://{MANAGER_HOST}:{MANAGER_PORT}/api/"
 # --- Worker Operation Intervals ---
 HEARTBEAT_INTERVAL_SECONDS = get_config_value('worker', 'heartbeat_interval', 30, is_int=True)
 JOB_POLLING_INTERVAL_SECONDS = get_config_value('worker', 'polling_interval', 5, is_int=True)
+# Idle polling backs off from polling_interval up to this ceiling while no jobs are queued.
+MAX_JOB_POLLING_INTERVAL_SECONDS = get_config_value('worker', 'max_polling_interval', 30, is_int=True)
 
 # --- Worker Hardware Configuration ---
 # These settings are mutually exclusive and can be set via environment variables.
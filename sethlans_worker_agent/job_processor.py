@@ -32,6 +32,11 @@ logger = logging.getLogger(__name__)
 _gpu_assignment_map = {}
 # A thread-safe lock to ensure only one CPU-bound job runs at a time.
 _cpu_lock = threading.Lock()
+# Processing threads dispatched by get_and_claim_job. Only the main loop touches this list.
+_job_threads = []
+# Matches Blender's whole "Time: [HH:]MM:SS.ff (Saving: ...)" summary line. "Time" must
+# start the line, which rules out the "| Time:" field of progress lines.
+_TIME_LINE_REGEX = re.compile(r"\s*Time: (?:(\d{2}):)?(\d{2}):(\d{2}\.\d{2}) \(Saving:")
 
 
 def _get_next_available_gpu() -> Optional[int]:
@@ -64,7 +69,11 @@ def _get_next_available_gpu() -> Optional[int]:
 def _parse_render_time(stdout_text):
     """
     Parses Blender's stdout log content to find the total render time by
-    finding the unique final summary line containing "(Saving:)".
+    finding the final summary line containing "(Saving:)".
+
+    The summary line is located by searching backwards from the end of the log,
+    so the log is never split into lines and only that one line is matched
+    against the time pattern.
 
     Args:
         stdout_text (str): The full stdout log from the Blender subprocess.
@@ -73,23 +82,28 @@ def _parse_render_time(stdout_text):
         int or None: The total render time in seconds, rounded up to the nearest
                      whole number, or None if the time could not be parsed.
     """
-    time_line_regex = re.compile(r"Time: (?:(\d{2}):)?(\d{2}):(\d{2}\.\d{2})")
-
-    for line in stdout_text.splitlines():
-        if "(Saving:" in line:
-            match = time_line_regex.search(line)
-            if match:
-                try:
-                    hours_str, minutes_str, seconds_str = match.groups()
-                    hours = int(hours_str) if hours_str else 0
-                    minutes = int(minutes_str)
-                    seconds = float(seconds_str)
-                    total_seconds = int(math.ceil((hours * 3600) + (minutes * 60) + seconds))
-                    logger.info(f"Parsed render time: {total_seconds} seconds from line: '{line.strip()}'")
-                    return total_seconds
-                except (IndexError, ValueError) as e:
-                    logger.warning(f"Found summary line but failed to parse time: '{line.strip()}' - {e}")
-                    return None
+    saving_index = stdout_text.rfind("(Saving:")
+    if saving_index == -1:
+        logger.warning("Could not find the final 'Time: ... (Saving: ...)' summary line in the render output.")
+        return None
+
+    line_start = stdout_text.rfind("\n", 0, saving_index) + 1
+    line_end = stdout_text.find("\n", saving_index)
+    line = stdout_text[line_start:line_end if line_end != -1 else len(stdout_text)]
+
+    match = _TIME_LINE_REGEX.match(line)
+    if match:
+        try:
+            hours_str, minutes_str, seconds_str = match.groups()
+            hours = int(hours_str) if hours_str else 0
+            minutes = int(minutes_str)
+            seconds = float(seconds_str)
+            total_seconds = int(math.ceil((hours * 3600) + (minutes * 60) + seconds))
+            logger.info(f"Parsed render time: {total_seconds} seconds from line: '{line.strip()}'")
+            return total_seconds
+        except (IndexError, ValueError) as e:
+            logger.warning(f"Found summary line but failed to parse time: '{line.strip()}' - {e}")
+            return None
     logger.warning("Could not find the final 'Time: ... (Saving: ...)' summary line in the render output.")
     return None
 
@@ -101,6 +115,8 @@ def poll_and_claim_job(worker_id: int) -> Optional[Dict[str, Any]]:
     This function sends a request to the manager's job list endpoint, applying
     filters based on the worker's configured hardware capabilities. If a job is
     available, it attempts to claim it by updating the `assigned_worker` field.
+    The claim request also sets the job to 'RENDERING' with its `started_at`
+    timestamp, so no separate start update is needed.
 
     In GPU split mode, it prioritizes GPUs for 'ANY' jobs but will fall back to
     the CPU if all GPUs are busy.
@@ -119,7 +135,8 @@ def poll_and_claim_job(worker_id: int) -> Optional[Dict[str, Any]]:
         logger.info("FORCE_GPU_ONLY is enabled, but no GPUs were detected. Skipping job poll.")
         return None
 
-    params = {'status': 'QUEUED', 'assigned_worker__isnull': 'true'}
+    # Only the first job of a poll is ever claimed, so only one is requested.
+    params = {'status': 'QUEUED', 'assigned_worker__isnull': 'true', 'limit': '1'}
     if config.FORCE_GPU_ONLY:
         params['gpu_available'] = 'true'
     elif config.FORCE_CPU_ONLY:
@@ -168,8 +185,9 @@ def poll_and_claim_job(worker_id: int) -> Optional[Dict[str, Any]]:
                 return None
 
     # --- Unified Claim Attempt ---
-    logger.info(f"Found {len(available_jobs)} available job(s). Attempting to claim job '{job_name}' (ID: {job_id})...")
-    if api_handler.claim_job(job_id, worker_id):
+    logger.info(f"Found an available job. Attempting to claim job '{job_name}' (ID: {job_id})...")
+    start_time = datetime.datetime.now(datetime.timezone.utc).isoformat().replace('+00:00', 'Z')
+    if api_handler.claim_job(job_id, worker_id, started_at=start_time):
         logger.info(f"Successfully claimed job '{job_name}'!")
         job_to_claim['assigned_gpu_index'] = assigned_gpu_index
         job_to_claim['_acquired_cpu_lock'] = acquired_cpu_lock
@@ -186,12 +204,12 @@ def process_claimed_job(job_data: Dict[str, Any]):
     """
     Processes a job that has already been claimed by this worker.
 
-    This function handles the entire execution lifecycle for a claimed job:
-    1. Updates the job status to 'RENDERING' and sets the `started_at` timestamp.
-    2. Executes the Blender render subprocess.
-    3. Parses the result and determines the final status ('DONE', 'ERROR', etc.).
-    4. Uploads the render output if successful.
-    5. Reports the final status and metadata back to the manager.
+    This function handles the entire execution lifecycle for a claimed job,
+    which the claim request has already marked as 'RENDERING':
+    1. Executes the Blender render subprocess.
+    2. Parses the result and determines the final status ('DONE', 'ERROR', etc.).
+    3. Uploads the render output if successful.
+    4. Reports the final status and metadata back to the manager.
 
     Args:
         job_data (dict): The dictionary of job data returned from a successful claim.
@@ -201,10 +219,6 @@ def process_claimed_job(job_data: Dict[str, Any]):
     # This thread is now responsible for the lock that the main thread acquired.
     acquired_cpu_lock = job_data.get('_acquired_cpu_lock', False)
 
-    # --- FIX: Send started_at timestamp when beginning the job ---
-    start_time = datetime.datetime.now(datetime.timezone.utc).isoformat().replace('+00:00', 'Z')
-    api_handler.update_job_status(job_id, {"status": "RENDERING", "started_at": start_time})
-
     if config.GPU_SPLIT_MODE and assigned_gpu_index is not None:
         _gpu_assignment_map[assigned_gpu_index] = job_id
         logger.info(f"Assigned job {job_id} to GPU {assigned_gpu_index}. Current assignments: {_gpu_assignment_map}")
@@ -266,5 +280,21 @@ def get_and_claim_job(worker_id):
         logger.info(f"Dispatching job {job_id} to a new processing thread.")
         job_thread = threading.Thread(target=process_claimed_job, args=(job_data,))
         job_thread.start()
+        _job_threads.append(job_thread)
         return True
-    return False
\ No newline at end of file
+    return False
+
+
+def has_active_jobs():
+    """
+    Reports whether any dispatched job is still being processed.
+
+    A poll that claims nothing while a job is running usually means the job's
+    resources are busy rather than that the queue is empty, so the main loop
+    uses this to tell a busy worker from an idle one.
+
+    Returns:
+        bool: True if at least one job processing thread is still alive.
+    """
+    _job_threads[:] = [thread for thread in _job_threads if thread.is_alive()]
+    return bool(_job_threads)
\ No newline at end of file
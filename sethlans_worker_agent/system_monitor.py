@@ -29,7 +29,7 @@ import json
 import re
 from collections import defaultdict
 import psutil  # --- NEW ---
-from sethlans_worker_agent import config
+from sethlans_worker_agent import api_handler, config
 from sethlans_worker_agent.tool_manager import tool_manager_instance
 from sethlans_worker_agent.utils import blender_release_parser
 
@@ -40,6 +40,8 @@ WORKER_ID = None
 HOSTNAME = socket.gethostname()
 IP_ADDRESS = socket.gethostbyname(HOSTNAME)
 OS_INFO = f"{platform.system()} {platform.release()}"
+# Cycles GPU backends, most preferred first.
+GPU_BACKEND_PREFERENCE = ('OPTIX', 'CUDA', 'HIP', 'METAL', 'ONEAPI')
 _gpu_devices_cache = None
 _gpu_details_cache = None
 _cpu_thread_count_cache = None  # --- NEW ---
@@ -89,8 +91,7 @@ def _filter_preferred_gpus(devices):
 
         # Fallback for non-NVIDIA cards (e.g., AMD, Intel) or if the above logic somehow fails
         if not best_option:
-            backend_preference = ['OPTIX', 'CUDA', 'HIP', 'METAL', 'ONEAPI']
-            for backend in backend_preference:
+            for backend in GPU_BACKEND_PREFERENCE:
                 if backend in available_backends:
                     best_option = next((d for d in device_options if d['type'] == backend), None)
                     if best_option:
@@ -298,12 +299,11 @@ def register_with_manager():
         logger.critical(f"Could not acquire Blender {latest_lts_version}. Registration aborted.")
         return None
 
-    heartbeat_url = f"{config.MANAGER_API_URL}heartbeat/"
     payload = get_system_info()
 
-    logger.info(f"Sending registration heartbeat to {heartbeat_url}...")
+    logger.info(f"Sending registration heartbeat to {config.MANAGER_API_URL}heartbeat/...")
     try:
-        response = requests.post(heartbeat_url, json=payload, timeout=10)
+        response = api_handler.post_heartbeat(payload, timeout=10)
         response.raise_for_status()
 
         data = response.json()
@@ -333,11 +333,10 @@ def send_heartbeat():
         logger.warning("Cannot send heartbeat, worker is not registered.")
         return
 
-    heartbeat_url = f"{config.MANAGER_API_URL}heartbeat/"
     payload = {"hostname": HOSTNAME}
 
     try:
-        response = requests.post(heartbeat_url, json=payload, timeout=5)
+        response = api_handler.post_heartbeat(payload)
         response.raise_for_status()
         logger.debug("Periodic heartbeat successful.")
     except requests.exceptions.RequestException as e:
@@ -43,6 +43,8 @@ class ToolManager:
     def __init__(self):
         self.tools_dir = Path(config.MANAGED_TOOLS_DIR)
         self.blender_dir = self.tools_dir / "blender"
+        # Maps a requested version string to the executable it last resolved to.
+        self._resolved_paths = {}
 
     def _create_tools_directory_if_not_exists(self):
         """
@@ -228,6 +230,9 @@ class ToolManager:
         downloading from the web, verifying the integrity with a SHA256 hash,
         and finally extracting the archive and setting permissions.
 
+        Successful results are remembered per requested version, so repeat calls
+        only check that the cached executable still exists.
+
         Args:
             requested_version (str): The requested Blender version (e.g., '4.5' or '4.5.1').
 
@@ -235,6 +240,10 @@ class ToolManager:
             str or None: The absolute path to the Blender executable if successful,
                          otherwise None.
         """
+        cached_path = self._resolved_paths.get(requested_version)
+        if cached_path and os.path.isfile(cached_path):
+            return cached_path
+
         self._create_tools_directory_if_not_exists()
 
         full_version = self._resolve_version(requested_version)
@@ -247,6 +256,7 @@ class ToolManager:
         exe_path = self.get_blender_executable_path(full_version)
         if exe_path:
             logger.info(f"Blender version {full_version} already available locally. Path: {exe_path}")
+            self._resolved_paths[requested_version] = exe_path
             return exe_path
 
         # 2. If not, find download URL
@@ -266,19 +276,15 @@ class ToolManager:
             logger.error(f"Could not find a download URL for Blender {full_version} on platform {platform_id}.")
             return None
 
-        # 3. Download, Verify, and Extract
-        try:
-            download_path = file_operations.download_file(url, self.blender_dir)
-
-            if not expected_hash:
-                logger.error(
-                    f"No SHA256 hash found for {os.path.basename(download_path)}. Deleting unverified file for security.")
-                os.remove(download_path)
-                return None
+        if not expected_hash:
+            logger.error(f"No SHA256 hash found for {os.path.basename(url)}. Refusing to download an unverifiable file.")
+            return None
 
-            if not file_operations.verify_hash(download_path, expected_hash):
-                logger.error("Hash verification failed. Deleting corrupt file.")
-                os.remove(download_path)
+        # 3. Download (verifying the hash while streaming) and Extract
+        try:
+            download_path = file_operations.download_file(url, self.blender_dir, expected_hash=expected_hash)
+            if not download_path:
+                logger.error("Hash verification failed. The corrupt file was deleted.")
                 return None
 
             # Only extract if hash is present and verified
@@ -297,6 +303,8 @@ class ToolManager:
             st = os.stat(final_exe_path)
             os.chmod(final_exe_path, st.st_mode | stat.S_IEXEC)
 
+        if final_exe_path:
+            self._resolved_paths[requested_version] = final_exe_path
         return final_exe_path
 
 
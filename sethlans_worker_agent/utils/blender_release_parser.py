@@ -18,16 +18,85 @@ the latest patch version of each major.minor series.
 """
 
 import logging
+import os
 import requests
 import re
-from bs4 import BeautifulSoup
+import requests_cache
+from concurrent.futures import ThreadPoolExecutor
+from selectolax.lexbor import LexborHTMLParser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from sethlans_worker_agent import config
 from . import hash_parser
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://download.blender.org/release/"
-VERSION_REGEX = re.compile(r'^Blender(\d+\.\d+)/$')
+VERSION_REGEX = re.compile(r'^Blender(\d+)\.\d+/$')
+# Only Blender 4.0 and newer are supported.
+MIN_MAJOR_VERSION = 4
 FILE_REGEX = re.compile(r'blender-(\d+\.\d+\.\d+)-(.+)\.(zip|tar\.xz|dmg|msi|msix)')
+# The release pages change rarely, so scraped responses are cached on disk for an hour.
+PAGE_CACHE_PATH = config.MANAGED_TOOLS_DIR / 'blender_release_pages.sqlite'
+PAGE_CACHE_EXPIRE_SECONDS = 3600
+# Version pages are fetched concurrently; matches the session's connection pool size.
+MAX_PAGE_FETCH_WORKERS = 8
+
+
+def _create_session():
+    """
+    Creates the HTTP session used for scraping the download site.
+
+    A single pooled session keeps the connection to download.blender.org alive
+    across the index and per-version page requests, instead of paying a new
+    TCP and TLS handshake for every page. Transient failures are retried with
+    a short backoff. Successful responses are stored in a SQLite cache so
+    repeated worker startups do not re-download unchanged pages.
+
+    Returns:
+        requests_cache.CachedSession: The configured session.
+    """
+    session = requests_cache.CachedSession(
+        str(PAGE_CACHE_PATH), backend='sqlite', expire_after=PAGE_CACHE_EXPIRE_SECONDS)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_session = None
+
+
+def _get_session():
+    """
+    Returns the shared scraping session, creating it on first use.
+
+    Creation is deferred because the cached session opens its SQLite file
+    immediately.
+
+    Returns:
+        requests_cache.CachedSession: The shared session.
+    """
+    global _session
+    if _session is None:
+        _session = _create_session()
+    return _session
+
+
+def clear_page_cache():
+    """
+    Discards the shared session and deletes the on-disk page cache.
+
+    Callers that remove the generated versions cache to force a fresh scrape
+    must clear this as well, otherwise the scrape is served from stale pages.
+    """
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
+    if os.path.exists(PAGE_CACHE_PATH):
+        os.remove(PAGE_CACHE_PATH)
 
 
 def get_blender_releases():
@@ -48,23 +117,17 @@ def get_blender_releases():
     all_releases = {}
     logger.info("Performing dynamic Blender download info generation (4.x+ only)...")
     try:
-        response = requests.get(BASE_URL, timeout=10)
+        response = _get_session().get(BASE_URL, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-
-        for a_tag in soup.find_all('a'):
-            href = a_tag.get('href')
-            match = VERSION_REGEX.match(href)
-            if not match:
-                continue
-
-            major_version_str = match.group(1)
-            if float(major_version_str) < 4.0:
-                continue
+        tree = LexborHTMLParser(response.content)
 
-            version_url = f"{BASE_URL}{href}"
-            logger.debug(f"Parsing major version page: {version_url}")
-            parse_version_page(version_url, all_releases)
+        # Each page fills its own dict so no state is shared between threads;
+        # merging in submission order keeps the result deterministic.
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_FETCH_WORKERS) as executor:
+            page_results = executor.map(_collect_version_page, parse_major_version_directories(tree))
+            for page_releases in page_results:
+                for version, platforms in page_releases.items():
+                    all_releases.setdefault(version, {}).update(platforms)
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to fetch Blender release index: {e}")
@@ -89,6 +152,57 @@ def get_blender_releases():
     return final_releases
 
 
+def _iter_hrefs(tree):
+    """
+    Yields the `href` of every anchor in a parsed page.
+
+    Only anchors are needed from the download site, so the Lexbor-backed
+    selectolax parser is used instead of building a full BeautifulSoup tree.
+
+    Args:
+        tree (LexborHTMLParser): The parsed page.
+
+    Yields:
+        str: Each anchor's `href` value.
+    """
+    for node in tree.css('a[href]'):
+        yield node.attributes['href']
+
+
+def parse_major_version_directories(tree):
+    """
+    Extracts the URLs of the 4.0+ major version directories from the release index.
+
+    Args:
+        tree (LexborHTMLParser): The parsed `download.blender.org/release/` page.
+
+    Yields:
+        str: The absolute URL of each matching version directory
+             (e.g., `'https://download.blender.org/release/Blender4.1/'`),
+             in page order.
+    """
+    for href in _iter_hrefs(tree):
+        match = VERSION_REGEX.match(href)
+        if match and int(match.group(1)) >= MIN_MAJOR_VERSION:
+            yield f"{BASE_URL}{href}"
+
+
+def _collect_version_page(url):
+    """
+    Parses a single version page into a new dictionary.
+
+    Args:
+        url (str): The URL of the version page to parse.
+
+    Returns:
+        dict: The release data found on the page.
+    """
+    logger.debug(f"Parsing major version page: {url}")
+    releases = {}
+    parse_version_page(url, releases)
+    return releases
+
+
 def parse_version_page(url, releases):
     """
     Parses a specific Blender version page for download links and SHA256 hashes.
@@ -103,21 +217,20 @@ def parse_version_page(url, releases):
         releases (dict): The dictionary to populate with the parsed release data.
     """
     try:
-        response = requests.get(url, timeout=10)
+        response = _get_session().get(url, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
+        hrefs = list(_iter_hrefs(LexborHTMLParser(response.content)))
 
         # Pre-fetch all hashes for this version page
         version_from_url = url.strip('/').split('/')[-1].replace('Blender', '')
-        sha_files = [a.get('href') for a in soup.find_all('a') if '.sha256' in a.get('href', '')]
+        sha_files = [href for href in hrefs if '.sha256' in href]
         all_hashes = {}
         for sha_file in sha_files:
             sha_url = f"{url}{sha_file}"
-            all_hashes.update(hash_parser.get_all_hashes_from_url(sha_url))
+            all_hashes.update(hash_parser.get_all_hashes_from_url(sha_url, _get_session()))
 
         # Find download links and match them with pre-fetched hashes
-        for a_tag in soup.find_all('a'):
-            href = a_tag.get('href')
+        for href in hrefs:
             file_match = FILE_REGEX.match(href)
             if not file_match:
                 continue
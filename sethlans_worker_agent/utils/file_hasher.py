@@ -13,43 +13,99 @@
 """
 Utility for performing file integrity checks.
 
-This module contains a single function for calculating the SHA256 hash
-of a file, which is essential for verifying the integrity of downloaded
+This module contains functions for calculating the SHA256 hash of one or
+more files, which is essential for verifying the integrity of downloaded
 Blender archives.
 """
 
 import hashlib
 import datetime
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import logging
 logger = logging.getLogger(__name__)
 
 
-def calculate_file_sha256(file_path, chunk_size=4096):
+# Hashes of files already processed, keyed by (absolute path, st_mtime_ns, st_size).
+_hash_cache = {}
+
+
+def calculate_file_sha256(file_path):
     """
     Calculates the SHA256 hash of a file.
 
-    The file is read in chunks to efficiently handle large files without
-    consuming excessive memory.
+    Results are memoized by the file's absolute path, modification time and
+    size, so hashing an unchanged file a second time does not re-read it.
+    Failures are never cached.
 
     Args:
         file_path (str): The path to the file to be hashed.
-        chunk_size (int): The size of the chunks to read.
 
     Returns:
         str or None: The hexadecimal SHA256 hash string, or None if an
                      error occurs (e.g., file not found).
     """
-    sha256_hash = hashlib.sha256()
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        # Let the uncached path report the error consistently.
+        return _calculate_file_sha256_uncached(file_path)
+
+    cache_key = (os.path.abspath(file_path), stat_result.st_mtime_ns, stat_result.st_size)
+    cached_hash = _hash_cache.get(cache_key)
+    if cached_hash is not None:
+        return cached_hash
+
+    calculated_hash = _calculate_file_sha256_uncached(file_path)
+    if calculated_hash is not None:
+        _hash_cache[cache_key] = calculated_hash
+    return calculated_hash
+
+
+def calculate_files_sha256(file_paths, max_workers=None):
+    """
+    Calculates the SHA256 hashes of several files in parallel.
+
+    `hashlib` releases the GIL while digesting, so hashing on a thread pool
+    scales with the number of cores when verifying several large archives.
+
+    Args:
+        file_paths (list): The paths of the files to be hashed.
+        max_workers (int, optional): The size of the thread pool. Defaults to
+            the number of logical CPUs.
+
+    Returns:
+        dict: A dictionary mapping each path to its hexadecimal SHA256 hash,
+              or to None if that file could not be hashed.
+    """
+    file_paths = list(file_paths)
+    if not file_paths:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return dict(zip(file_paths, executor.map(calculate_file_sha256, file_paths)))
+
+
+def _calculate_file_sha256_uncached(file_path):
+    """
+    Reads a file and calculates its SHA256 hash without consulting the cache.
+
+    Hashing is delegated to `hashlib.file_digest`, which streams the file
+    into the digest in C without a per-chunk Python loop.
+
+    Args:
+        file_path (str): The path to the file to be hashed.
+
+    Returns:
+        str or None: The hexadecimal SHA256 hash string, or None on error.
+    """
     try:
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(chunk_size), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
     except FileNotFoundError:
         logger.error(f"File not found for hash calculation: {file_path}")
         return None
     except Exception as e:
         logger.error(f"Failed to calculate hash for {file_path}: {e}")
-        return None
\ No newline at end of file
+        return None
@@ -27,10 +27,15 @@ import platform
 import subprocess
 import tarfile
 import time
+import urllib3
 from tqdm import tqdm
+from tqdm.utils import CallbackIOWrapper
 
 logger = logging.getLogger(__name__)
 
+# Large reads keep write() syscalls and Python per-chunk overhead low on multi-hundred-MB archives.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 # --- JSON Operations ---
 def load_json(file_handle):
@@ -58,34 +63,94 @@ def dump_json(data, file_handle):
 
 
 # --- Download and Archive Operations ---
-def download_file(url, dest_folder):
+def download_file(url, dest_folder, expected_hash=None, algorithm='sha256'):
     """
     Downloads a file from a URL to a local destination with a progress bar.
 
+    If an expected hash is given, each chunk is hashed as it is written so the
+    file is verified in the same pass, without reading it back from disk. A
+    file that fails verification is deleted. Otherwise, uncompressed responses
+    are copied straight from the socket with `shutil.copyfileobj`. A file
+    shorter or longer than the server's Content-Length is also deleted.
+
     Args:
         url (str): The URL of the file to download.
         dest_folder (str): The path to the local directory to save the file.
+        expected_hash (str, optional): The known hash value to verify against.
+        algorithm (str): The hashing algorithm to use (e.g., 'sha256').
 
     Returns:
-        str: The full local path to the downloaded file.
+        str or None: The full local path to the downloaded file, or None if
+                     size or hash verification failed.
     """
     local_filename = url.split('/')[-1]
     download_path = os.path.join(dest_folder, local_filename)
+    hasher = hashlib.new(algorithm) if expected_hash else None
 
     logger.info(f"Downloading {url} to {download_path}...")
     with requests.get(url, stream=True) as r:
         r.raise_for_status()
         total_size = int(r.headers.get('content-length', 0))
-        with open(download_path, 'wb') as f, tqdm(
-                total=total_size, unit='iB', unit_scale=True, desc=local_filename
-        ) as bar:
-            for chunk in r.iter_content(chunk_size=8192):
-                size = f.write(chunk)
-                bar.update(size)
+        # Content-Length describes the encoded body, so it only matches the file when there is no encoding.
+        expected_size = total_size if total_size and not r.headers.get('content-encoding') else None
+        try:
+            with open(download_path, 'wb') as f, tqdm(
+                    total=total_size, unit='iB', unit_scale=True, desc=local_filename
+            ) as bar:
+                if hasher is None and expected_size is not None:
+                    _copy_raw_body(r, CallbackIOWrapper(bar.update, f, 'write'))
+                else:
+                    for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        size = f.write(chunk)
+                        if hasher:
+                            hasher.update(chunk)
+                        bar.update(size)
+        except requests.exceptions.RequestException:
+            os.remove(download_path)
+            raise
     logger.info("Download complete.")
+
+    if expected_size is not None and os.path.getsize(download_path) != expected_size:
+        logger.error(f"Download size mismatch. Expected {expected_size} bytes, "
+                     f"got {os.path.getsize(download_path)}")
+        os.remove(download_path)
+        return None
+
+    if hasher:
+        calculated_hash = hasher.hexdigest()
+        if calculated_hash != expected_hash.lower():
+            logger.error(f"Hash verification FAILED. Expected {expected_hash}, got {calculated_hash}")
+            os.remove(download_path)
+            return None
+        logger.info("Hash verification SUCCESS!")
     return download_path
 
 
+def _copy_raw_body(response, dest):
+    """
+    Copies a streamed response body straight from the socket into `dest`.
+
+    Reading `response.raw` bypasses the error translation `iter_content` does,
+    so a dropped or truncated connection would surface as a urllib3 error.
+    Those are re-raised as the matching requests exceptions here so callers
+    only have to handle `requests.exceptions.RequestException`.
+
+    Args:
+        response (requests.Response): A response opened with `stream=True`.
+        dest (file): A writable file-like object.
+
+    Raises:
+        requests.exceptions.ChunkedEncodingError: If the connection broke mid-body.
+        requests.exceptions.ConnectionError: If reading the body timed out.
+    """
+    try:
+        shutil.copyfileobj(response.raw, dest, DOWNLOAD_CHUNK_SIZE)
+    except urllib3.exceptions.ProtocolError as e:
+        raise requests.exceptions.ChunkedEncodingError(e) from e
+    except urllib3.exceptions.ReadTimeoutError as e:
+        raise requests.exceptions.ConnectionError(e) from e
+
+
 def verify_hash(file_path, expected_hash, algorithm='sha256'):
     """
     Verifies the hash of a downloaded file against an expected value.
@@ -99,12 +164,11 @@ def verify_hash(file_path, expected_hash, algorithm='sha256'):
         bool: True if the hashes match, False otherwise.
     """
     logger.info(f"Verifying hash of {file_path}...")
-    hasher = hashlib.new(algorithm)
+
+    # file_digest streams the file into the digest in C, without a per-chunk Python loop.
     with open(file_path, 'rb') as f:
-        while chunk := f.read(8192):
-            hasher.update(chunk)
+        calculated_hash = hashlib.file_digest(f, algorithm).hexdigest()
 
-    calculated_hash = hasher.hexdigest()
     if calculated_hash == expected_hash:
         logger.info("Hash verification SUCCESS!")
         return True
@@ -197,9 +261,15 @@ def extract_archive(archive_path, extract_to):
         return extracted_path
 
     elif archive_path.endswith(".tar.xz"):
-        logger.info(f"Extracting {archive_path} to {extract_to} using tarfile with 'data' filter...")
-        with tarfile.open(archive_path, 'r:xz') as tar:
-            tar.extractall(path=extract_to, filter='data')
+        xz_path = shutil.which('xz')
+        if xz_path:
+            logger.info(f"Extracting {archive_path} to {extract_to} using multi-threaded xz "
+                        f"and tarfile with 'data' filter...")
+            _extract_tar_xz_with_xz(xz_path, archive_path, extract_to)
+        else:
+            logger.info(f"Extracting {archive_path} to {extract_to} using tarfile with 'data' filter...")
+            with tarfile.open(archive_path, 'r:xz') as tar:
+                tar.extractall(path=extract_to, filter='data')
         extracted_dir_name = archive_name[:-7]
     else:
         # For .zip and other formats, shutil is still fine.
@@ -215,6 +285,29 @@ def extract_archive(archive_path, extract_to):
     return full_extracted_path
 
 
+def _extract_tar_xz_with_xz(xz_path, archive_path, extract_to):
+    """
+    Extracts a `.tar.xz` archive, decompressing with the external `xz` tool.
+
+    Python's LZMA decoder is single-threaded; `xz -T0` decompresses on all
+    cores. The decompressed stream is still unpacked by `tarfile` so the
+    'data' extraction filter keeps applying.
+
+    Args:
+        xz_path (str): The path to the `xz` executable.
+        archive_path (str): The full path to the archive file.
+        extract_to (str): The destination directory for the extracted contents.
+
+    Raises:
+        subprocess.CalledProcessError: If `xz` exits with an error.
+    """
+    with subprocess.Popen([xz_path, '-dc', '-T0', archive_path], stdout=subprocess.PIPE) as process:
+        with tarfile.open(fileobj=process.stdout, mode='r|') as tar:
+            tar.extractall(path=extract_to, filter='data')
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, process.args)
+
+
 def cleanup_archive(archive_path):
     """
     Deletes the specified file from the filesystem.
@@ -16,13 +16,19 @@ returning a dictionary that maps filenames to their corresponding SHA256 hashes.
 This is used to verify the integrity of downloaded Blender archives.
 """
 
+import functools
 import logging
+import re
 import requests
 
 logger = logging.getLogger(__name__)
 
+# One `hash filename` pair per line; lines with any other number of fields are skipped.
+# A leading `*` on the filename is sha256sum's binary-mode marker and is not captured.
+HASH_LINE_REGEX = re.compile(r'^[^\S\n]*(\S+)[^\S\n]+\*?(\S+)[^\S\n]*$', re.MULTILINE)
 
-def get_all_hashes_from_url(sha_url):
+
+def get_all_hashes_from_url(sha_url, session=None):
     """
     Fetches a `.sha256` file and returns a dictionary of all hashes.
 
@@ -30,19 +36,36 @@ def get_all_hashes_from_url(sha_url):
 
     Args:
         sha_url (str): The URL of the `.sha256` file.
+        session (requests.Session, optional): The session to fetch with, so the
+            scraper's pooled connection is reused. Defaults to a one-off request.
 
     Returns:
         dict: A dictionary where keys are filenames and values are the SHA256 hashes.
     """
     hashes = {}
     try:
-        response = requests.get(sha_url, timeout=5)
-        response.raise_for_status()
-        for line in response.text.splitlines():
-            parts = line.strip().split()
-            if len(parts) == 2:
-                hash_value, filename = parts
-                hashes[filename] = hash_value
+        # Copy so callers can modify the result without touching the cached entry.
+        hashes = dict(_fetch_hashes(sha_url, session))
     except requests.exceptions.RequestException as e:
         logger.warning(f"Could not fetch or parse hash file {sha_url}: {e}")
-    return hashes
\ No newline at end of file
+    return hashes
+
+
+@functools.lru_cache(maxsize=128)
+def _fetch_hashes(sha_url, session=None):
+    """
+    Downloads and parses a `.sha256` file.
+
+    Published hash files never change, so each URL is fetched and parsed at
+    most once per process. Failed requests raise and are therefore not cached.
+
+    Args:
+        sha_url (str): The URL of the `.sha256` file.
+        session (requests.Session, optional): The session to fetch with.
+
+    Returns:
+        dict: The parsed filename-to-hash mapping. Callers must not modify it.
+    """
+    response = (session or requests).get(sha_url, timeout=5)
+    response.raise_for_status()
+    return {filename: hash_value for hash_value, filename in HASH_LINE_REGEX.findall(response.text)}
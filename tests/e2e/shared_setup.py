@@ -145,9 +145,10 @@ class BaseE2ETest:
                 f"Cannot find download info for Blender {cls._blender_version_for_test} on {platform_id}")
 
         try:
-            downloaded_archive = file_operations.download_file(release_info['url'], str(cache_root))
-            if not file_operations.verify_hash(downloaded_archive, release_info['sha256']):
-                raise IOError(f"Hash mismatch for cached Blender download: {downloaded_archive}")
+            downloaded_archive = file_operations.download_file(
+                release_info['url'], str(cache_root), expected_hash=release_info['sha256'])
+            if not downloaded_archive:
+                raise IOError(f"Hash mismatch for cached Blender download: {release_info['url']}")
 
             file_operations.extract_archive(downloaded_archive, str(cache_root))
             file_operations.cleanup_archive(downloaded_archive)
@@ -222,6 +223,33 @@ class BaseE2ETest:
                     raise RuntimeError("Worker process terminated unexpectedly during setup.")
         raise RuntimeError("Worker agent did not become ready within the time limit.")
 
+    @classmethod
+    def stop_worker(cls, process=None, grace_seconds=2):
+        """
+        Stops a worker process, escalating to a hard kill only if needed.
+
+        The worker is first asked to terminate. On POSIX the agent handles
+        SIGTERM like Ctrl+C, logging its shutdown before exiting; on Windows
+        `terminate()` is already immediate. If it has not exited within
+        `grace_seconds`, it is killed outright.
+
+        Args:
+            process (subprocess.Popen, optional): The worker process to stop.
+                Defaults to the class's current `worker_process`.
+            grace_seconds (int): How long to wait for a graceful exit.
+        """
+        process = process or cls.worker_process
+        if not process or process.poll() is not None:
+            return
+
+        process.terminate()
+        try:
+            process.wait(timeout=grace_seconds)
+        except subprocess.TimeoutExpired:
+            logger.warning("Worker process (PID: %s) did not exit after terminate(). Killing it.", process.pid)
+            process.kill()
+            process.wait(timeout=5)
+
     @classmethod
     def setup_class(cls):
         """Set up the environment once for all tests in this class."""
@@ -232,6 +260,7 @@ class BaseE2ETest:
             shutil.rmtree(MOCK_TOOLS_DIR, ignore_errors=True)
         if os.path.exists(worker_config.BLENDER_VERSIONS_CACHE_FILE):
             os.remove(worker_config.BLENDER_VERSIONS_CACHE_FILE)
+        blender_release_parser.clear_page_cache()
 
         # The session-level hooks now handle artifact directory cleanup.
         # We just need to ensure the media root exists for the current test class.
@@ -344,6 +373,7 @@ class BaseE2ETest:
 
         if os.path.exists(worker_config.BLENDER_VERSIONS_CACHE_FILE):
             os.remove(worker_config.BLENDER_VERSIONS_CACHE_FILE)
+        blender_release_parser.clear_page_cache()
 
         # Clean up mock environment variables to prevent test pollution
         if "SETHLANS_MOCK_CPU_ONLY" in os.environ:
@@ -188,9 +188,7 @@ class TestConcurrency(BaseE2ETest):
         print(f"\n--- E2E TEST: Multi-GPU Concurrent Rendering for {num_gpus} GPUs ---")
 
         # 1. Stop default worker and start one in split mode
-        if self.worker_process and self.worker_process.poll() is None:
-            self.worker_process.kill()
-            self.worker_process.wait(timeout=10)
+        self.stop_worker()
 
         self.worker_log_queue = queue.Queue()
         env = {"SETHLANS_GPU_SPLIT_MODE": "true"}
@@ -221,9 +219,7 @@ class TestConcurrency(BaseE2ETest):
         print("All jobs completed. Verifying logs for concurrent assignment...")
 
         # 4. Verify logs
-        if self.worker_process and self.worker_process.poll() is None:
-            self.worker_process.kill()
-            self.worker_process.wait(timeout=10)
+        self.stop_worker()
         if self.worker_log_thread and self.worker_log_thread.is_alive():
             self.worker_log_thread.join(timeout=5)
 
@@ -260,9 +256,7 @@ class TestConcurrency(BaseE2ETest):
         print(f"\n--- E2E TEST: 'ANY' Job CPU Fallback for {num_gpus} GPU(s) ---")
 
         # 1. Stop default worker and start one in split mode
-        if self.worker_process and self.worker_process.poll() is None:
-            self.worker_process.kill()
-            self.worker_process.wait(timeout=10)
+        self.stop_worker()
 
         self.worker_log_queue = queue.Queue()
         env = {"SETHLANS_GPU_SPLIT_MODE": "true"}
@@ -339,9 +333,7 @@ class TestConcurrency(BaseE2ETest):
         print("All jobs completed. Verifying logs for correct CPU fallback configuration...")
 
         # 7. Stop the worker and verify its logs
-        if self.worker_process and self.worker_process.poll() is None:
-            self.worker_process.kill()
-            self.worker_process.wait(timeout=10)
+        self.stop_worker()
         if self.worker_log_thread and self.worker_log_thread.is_alive():
             self.worker_log_thread.join(timeout=5)
 
@@ -143,9 +143,7 @@ class TestCoreWorkflows(BaseE2ETest):
         """
         print("\n--- E2E TEST: CPU Render with Thread Limit ---")
         # 1. Stop default worker and start one with the thread limit
-        if self.worker_process and self.worker_process.poll() is None:
-            self.worker_process.kill()
-            self.worker_process.wait(timeout=10)
+        self.stop_worker()
 
         # Use a new queue to isolate logs for this specific worker run
         log_queue = queue.Queue()
@@ -171,9 +169,7 @@ class TestCoreWorkflows(BaseE2ETest):
         poll_for_completion(job_url)
 
         # 4. Stop worker and inspect logs
-        if self.worker_process and self.worker_process.poll() is None:
-            self.worker_process.kill()
-            self.worker_process.wait(timeout=10)
+        self.stop_worker()
         if self.worker_log_thread and self.worker_log_thread.is_alive():
             self.worker_log_thread.join(timeout=5)
 
@@ -63,9 +63,7 @@ class TestGpuAssignment(BaseE2ETest):
             try:
                 # 1. Stop the default worker and start a dedicated one for this GPU index
                 print(f"\n--- Testing GPU Index {gpu_index} ---")
-                if self.worker_process and self.worker_process.poll() is None:
-                    self.worker_process.kill()
-                    self.worker_process.wait(timeout=10)
+                self.stop_worker()
 
                 self.worker_log_queue = queue.Queue()
                 env = {"SETHLANS_FORCE_GPU_INDEX": str(gpu_index)}
@@ -104,8 +102,7 @@ class TestGpuAssignment(BaseE2ETest):
                 # 4. Clean up the worker and ensure all logs are processed
                 if worker_for_this_gpu and worker_for_this_gpu.poll() is None:
                     print(f"Terminating worker for GPU {gpu_index}...")
-                    worker_for_this_gpu.kill()
-                    worker_for_this_gpu.wait(timeout=10)
+                    self.stop_worker(worker_for_this_gpu)
 
                 # --- FIX: Wait for the log thread to finish reading all output ---
                 if log_thread_for_this_gpu and log_thread_for_this_gpu.is_alive():
@@ -35,8 +35,7 @@ class TestHardwareModes(BaseE2ETest):
         """
         print("\n--- E2E TEST: Forced CPU Mode (Hardware Report) ---")
         # Stop the default worker and start one in forced CPU mode
-        if self.worker_process:
-            self.worker_process.kill()
+        self.stop_worker()
         self.start_worker(self.worker_log_queue, extra_env={"SETHLANS_FORCE_CPU_ONLY": "true"})
 
         response = requests.get(f"{MANAGER_URL}/heartbeat/")
@@ -55,8 +54,7 @@ class TestHardwareModes(BaseE2ETest):
         """
         print("\n--- E2E TEST: Forced CPU Mode (Job Filtering) ---")
         # Stop the default worker and start one in forced CPU mode
-        if self.worker_process:
-            self.worker_process.kill()
+        self.stop_worker()
         self.start_worker(self.worker_log_queue, extra_env={"SETHLANS_FORCE_CPU_ONLY": "true"})
 
         gpu_payload = {
@@ -97,8 +95,7 @@ class TestHardwareModes(BaseE2ETest):
 
         print("\n--- E2E TEST: Forced GPU Mode (Job Filtering) ---")
         # Stop the default worker and start one in forced GPU mode
-        if self.worker_process:
-            self.worker_process.kill()
+        self.stop_worker()
         self.start_worker(self.worker_log_queue, extra_env={"SETHLANS_FORCE_GPU_ONLY": "true"})
 
         gpu_payload = {
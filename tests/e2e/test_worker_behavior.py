@@ -119,9 +119,7 @@ class TestWorkerBehavior(BaseE2ETest):
         print("\n--- E2E TEST: Automatic CPU Thread Reservation ---")
 
         # 1. Stop default worker and start a fresh one to capture its specific logs
-        if self.worker_process and self.worker_process.poll() is None:
-            self.worker_process.kill()
-            self.worker_process.wait(timeout=10)
+        self.stop_worker()
 
         log_queue = queue.Queue()
         # Start with no extra env vars to ensure default mixed-mode operation
@@ -145,9 +143,7 @@ class TestWorkerBehavior(BaseE2ETest):
         poll_for_completion(job_url)
 
         # 4. Stop worker and get its logs
-        if self.worker_process and self.worker_process.poll() is None:
-            self.worker_process.kill()
-            self.worker_process.wait(timeout=10)
+        self.stop_worker()
         if self.worker_log_thread and self.worker_log_thread.is_alive():
             self.worker_log_thread.join(timeout=5)
 
@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# Copyright (c) 2025 Dryad and Naiad Software LLC
+#
+#
+# Created by Mario Estrella on 8/5/2025.
+# Dryad and Naiad Software LLC
+#
+# Project: sethlans_reborn
+#
+# tests/unit/worker_agent/conftest.py
+"""
+Shared fixtures for the worker agent unit tests.
+"""
+
+import time
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
+from unittest.mock import MagicMock
+
+from selectolax.lexbor import LexborHTMLParser
+
+from sethlans_worker_agent import config, system_monitor
+from sethlans_worker_agent.tool_manager import tool_manager_instance
+
+# A release index covering pre-4.x, 4.x+ and unrelated directories.
+DUMMY_MAIN_RELEASES_HTML = """
+<html><body>
+    <a href="../">../</a>
+    <a href="Blender1.0/">Blender1.0/</a>
+    <a href="Blender2.93/">Blender2.93/</a>
+    <a href="Blender3.6/">Blender3.6/</a>
+    <a href="Blender4.0/">Blender4.0/</a>
+    <a href="Blender4.1/">Blender4.1/</a>
+    <a href="Blender4.2/">Blender4.2/</a>
+    <a href="Blender4.3/">Blender4.3/</a>
+    <a href="Blender4.4/">Blender4.4/</a>
+    <a href="Blender4.5/">Blender4.5/</a>
+    <a href="Blender5.0/">Blender5.0/</a>
+    <a href="OtherDir/">OtherDir/</a>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Turns time.sleep into a no-op for every worker agent unit test."""
+    monkeypatch.setattr(time, 'sleep', lambda *args, **kwargs: None)
+
+
+# Two physical GPUs, shared read-only by every test that uses the execution mocks.
+_MOCK_GPU_DETAILS = (
+    MappingProxyType({'name': 'Mock Physical GPU 0', 'type': 'OPTIX', 'id': 'GPU_ID_0'}),
+    MappingProxyType({'name': 'Mock Physical GPU 1', 'type': 'OPTIX', 'id': 'GPU_ID_1'}),
+)
+
+
+class _Stream:
+    """A minimal stand-in for a binary subprocess pipe that yields canned chunks."""
+
+    def __init__(self, chunks):
+        self._it = iter(chunks)
+
+    def read1(self, size=-1):
+        return next(self._it, b'')
+
+    def close(self):
+        pass
+
+
+def _make_mock_process():
+    """Builds a fresh Popen stub whose streams have not been consumed yet."""
+    return SimpleNamespace(
+        pid=12345,
+        stdout=_Stream([b'Blender render complete.\n']),
+        stderr=_Stream([]),
+        poll=lambda: 0,
+        wait=lambda timeout=None: 0,
+    )
+
+
+@pytest.fixture
+def mock_exec_deps(mocker, monkeypatch):
+    """
+    Installs the standard patch set for execute_blender_job for a single test.
+
+    Every Popen call returns a new process stub. The returned dictionary also
+    exposes a `set_config` helper that overrides config attributes for the
+    duration of the current test only.
+    """
+    mocker.patch.multiple(
+        config,
+        WORKER_OUTPUT_DIR='/mock/worker_output',
+        WORKER_TEMP_DIR='/mock/worker_temp',
+        FORCE_CPU_ONLY=False,
+        FORCE_GPU_ONLY=False,
+    )
+
+    # Mock subprocess management
+    mock_popen = mocker.patch('subprocess.Popen', side_effect=lambda *args, **kwargs: _make_mock_process())
+
+    # Mock dependencies of execute_blender_job
+    mocker.patch('sethlans_worker_agent.api_handler.fetch_job',
+                 return_value=SimpleNamespace(status_code=200, json=lambda: {'status': 'RENDERING'}))
+    mocker.patch.object(tool_manager_instance, 'ensure_blender_version_available',
+                        return_value="/mock/tools/blender")
+    mocker.patch('os.path.exists', return_value=True)
+    mocker.patch('os.makedirs')
+    mocker.patch('os.remove')
+    mocker.patch('sethlans_worker_agent.asset_manager.ensure_asset_is_available',
+                 return_value="/mock/local/scene.blend")
+
+    # Stub the system_monitor dependency; no test inspects these calls.
+    mocker.patch.multiple(
+        system_monitor,
+        get_gpu_device_details=lambda: _MOCK_GPU_DETAILS,
+        get_cpu_thread_count=lambda: 16,
+    )
+
+    # Mock tempfile to capture script content
+    mock_write_method = MagicMock()
+    mock_temp_file_context = MagicMock()
+    mock_temp_file_context.__enter__.return_value.name = "/mock/worker_temp/fake_script.py"
+    mock_temp_file_context.__enter__.return_value.write = mock_write_method
+    mocker.patch('tempfile.NamedTemporaryFile', return_value=mock_temp_file_context)
+
+    def set_config(**overrides):
+        for name, value in overrides.items():
+            monkeypatch.setattr(config, name, value)
+
+    return {
+        "popen": mock_popen,
+        "script_write": mock_write_method,
+        "set_config": set_config,
+    }
+
+
+@pytest.fixture(scope="session")
+def dummy_main_releases_html():
+    """The raw dummy release index HTML."""
+    return DUMMY_MAIN_RELEASES_HTML
+
+
+@pytest.fixture(scope="session")
+def dummy_main_tree():
+    """
+    The dummy release index, parsed once per session with the production
+    parser. Tests must treat it as read-only.
+    """
+    return LexborHTMLParser(DUMMY_MAIN_RELEASES_HTML)
+
+
+@pytest.fixture(scope="session")
+def hello_sethlans_file(tmp_path_factory):
+    """A file containing b"Hello, Sethlans Reborn!", created once per session."""
+    path = tmp_path_factory.mktemp("hashdata") / "hello.bin"
+    path.write_bytes(b"Hello, Sethlans Reborn!")
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def empty_file(tmp_path_factory):
+    """An empty file, created once per session."""
+    path = tmp_path_factory.mktemp("hashdata") / "empty.bin"
+    path.write_bytes(b"")
+    return str(path)
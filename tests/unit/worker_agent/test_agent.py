@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# Copyright (c) 2025 Dryad and Naiad Software LLC
+#
+#
+# Created by Mario Estrella on 8/5/2025.
+# Dryad and Naiad Software LLC
+#
+# Project: sethlans_reborn
+#
+# tests/unit/worker_agent/test_agent.py
+"""
+Unit tests for the worker agent's main loop.
+"""
+
+import importlib
+import logging
+import logging.handlers
+import sys
+
+import pytest
+
+from sethlans_worker_agent import config, job_processor, system_monitor
+
+
+@pytest.fixture(scope="module")
+def agent():
+    """
+    Imports the agent module without its command-line parsing or log handlers
+    touching the test run.
+    """
+    root_logger = logging.getLogger()
+    saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sys, 'argv', ['agent.py'])
+        mp.setattr(logging.handlers, 'RotatingFileHandler', lambda *args, **kwargs: logging.NullHandler())
+        module = importlib.import_module('sethlans_worker_agent.agent')
+    yield module
+    root_logger.handlers[:] = saved_handlers
+    root_logger.setLevel(saved_level)
+
+
+def test_main_backs_off_while_idle_and_resets_after_claim(mocker, agent):
+    """
+    Tests that the idle poll interval doubles up to the maximum and drops back
+    to the base interval as soon as a job is claimed.
+    """
+    mocker.patch.object(config, 'JOB_POLLING_INTERVAL_SECONDS', 5)
+    mocker.patch.object(config, 'MAX_JOB_POLLING_INTERVAL_SECONDS', 30)
+    mocker.patch.object(system_monitor, 'register_with_manager', return_value=7)
+    mocker.patch.object(system_monitor, 'send_heartbeat')
+    mock_claim = mocker.patch.object(job_processor, 'get_and_claim_job',
+                                     side_effect=[False, False, False, False, True, False, KeyboardInterrupt])
+    mocker.patch.object(job_processor, 'has_active_jobs', return_value=False)
+    mock_sleep = mocker.patch.object(agent.time, 'sleep')
+
+    with pytest.raises(SystemExit) as exit_info:
+        agent.main()
+
+    assert exit_info.value.code == 0
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [5, 10, 20, 30, 5, 5]
+    mock_claim.assert_called_with(7)
+
+
+def test_main_keeps_base_interval_while_a_job_is_running(mocker, agent):
+    """
+    Tests that polls which claim nothing because the worker is busy do not
+    back off, so the next queued job is claimed promptly once the render ends.
+    """
+    mocker.patch.object(config, 'JOB_POLLING_INTERVAL_SECONDS', 5)
+    mocker.patch.object(config, 'MAX_JOB_POLLING_INTERVAL_SECONDS', 30)
+    mocker.patch.object(system_monitor, 'register_with_manager', return_value=7)
+    mocker.patch.object(system_monitor, 'send_heartbeat')
+    mocker.patch.object(job_processor, 'get_and_claim_job',
+                        side_effect=[True, False, False, False, False, False, KeyboardInterrupt])
+    # The claimed job renders through the next three polls, then the worker is idle.
+    mocker.patch.object(job_processor, 'has_active_jobs', side_effect=[True, True, True, False, False])
+    mock_sleep = mocker.patch.object(agent.time, 'sleep')
+
+    with pytest.raises(SystemExit):
+        agent.main()
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [5, 5, 5, 5, 5, 10]
+
+
+def test_sigterm_handler_uses_the_interrupt_shutdown_path(agent):
+    """Tests that SIGTERM is turned into the KeyboardInterrupt that main() exits on."""
+    with pytest.raises(KeyboardInterrupt):
+        agent._handle_sigterm(agent.signal.SIGTERM, None)
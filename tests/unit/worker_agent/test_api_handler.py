@@ -12,16 +12,21 @@ Unit tests for the api_handler module.
 """
 import pytest
 import requests
-from unittest.mock import MagicMock
 
 from sethlans_worker_agent import api_handler, config
 
 
-def test_poll_for_available_jobs_success(mocker):
+@pytest.fixture
+def mock_session(mocker):
+    """Replaces the shared manager API session with a mock."""
+    return mocker.patch.object(api_handler, '_session')
+
+
+def test_poll_for_available_jobs_success(mock_session):
     """
     Tests that poll_for_available_jobs returns job data on success.
     """
-    mock_get = mocker.patch('requests.get')
+    mock_get = mock_session.get
     mock_job_list = [{'id': 1, 'name': 'Test Job'}]
     mock_get.return_value.json.return_value = mock_job_list
     mock_get.return_value.raise_for_status.return_value = None
@@ -33,54 +38,90 @@ def test_poll_for_available_jobs_success(mocker):
     mock_get.assert_called_once_with(f"{config.MANAGER_API_URL}jobs/", params=params, timeout=10)
 
 
-def test_poll_for_available_jobs_failure(mocker):
+def test_poll_for_available_jobs_failure(mock_session):
     """
     Tests that poll_for_available_jobs returns None on a network error.
     """
-    mocker.patch('requests.get', side_effect=requests.exceptions.RequestException)
+    mock_session.get.side_effect = requests.exceptions.RequestException
     result = api_handler.poll_for_available_jobs({})
     assert result is None
 
 
-def test_claim_job_success(mocker):
+def test_claim_job_success(mock_session):
     """
     Tests that claim_job returns True on a 200 OK response.
     """
-    mock_patch = mocker.patch('requests.patch')
+    mock_patch = mock_session.patch
     mock_patch.return_value.status_code = 200
     result = api_handler.claim_job(1, 101)
     assert result is True
     mock_patch.assert_called_once_with(f"{config.MANAGER_API_URL}jobs/1/", json={"assigned_worker": 101}, timeout=5)
 
 
+def test_claim_job_with_start_time_also_starts_job(mock_session):
+    """
+    Tests that claim_job sends the RENDERING status and started_at in the claim request.
+    """
+    mock_session.patch.return_value.status_code = 200
+
+    result = api_handler.claim_job(1, 101, started_at="2025-08-05T12:00:00Z")
+
+    assert result is True
+    mock_session.patch.assert_called_once_with(
+        f"{config.MANAGER_API_URL}jobs/1/",
+        json={"assigned_worker": 101, "status": "RENDERING", "started_at": "2025-08-05T12:00:00Z"},
+        timeout=5)
+
+
 @pytest.mark.parametrize("status_code", [409, 404, 500])
-def test_claim_job_failure(mocker, status_code):
+def test_claim_job_failure(mock_session, status_code):
     """
     Tests that claim_job returns False on non-200 responses.
     """
-    mock_patch = mocker.patch('requests.patch')
+    mock_patch = mock_session.patch
     mock_patch.return_value.status_code = status_code
     result = api_handler.claim_job(1, 101)
     assert result is False
 
 
-def test_update_job_status(mocker):
+def test_update_job_status(mock_session):
     """
     Tests that update_job_status makes the correct PATCH request.
     """
-    mock_patch = mocker.patch('requests.patch')
+    mock_patch = mock_session.patch
     payload = {'status': 'DONE'}
     api_handler.update_job_status(5, payload)
     mock_patch.assert_called_once_with(f"{config.MANAGER_API_URL}jobs/5/", json=payload, timeout=5)
 
 
-def test_upload_render_output(mocker):
+def test_fetch_job_uses_shared_session(mock_session):
+    """
+    Tests that fetch_job GETs the job record over the shared session and returns the raw response.
+    """
+    response = api_handler.fetch_job(5)
+
+    mock_session.get.assert_called_once_with(f"{config.MANAGER_API_URL}jobs/5/", timeout=5)
+    assert response is mock_session.get.return_value
+
+
+def test_post_heartbeat_uses_shared_session(mock_session):
+    """
+    Tests that post_heartbeat POSTs to the heartbeat endpoint over the shared session.
+    """
+    response = api_handler.post_heartbeat({"hostname": "render-01"})
+
+    mock_session.post.assert_called_once_with(
+        f"{config.MANAGER_API_URL}heartbeat/", json={"hostname": "render-01"}, timeout=5)
+    assert response is mock_session.post.return_value
+
+
+def test_upload_render_output(mocker, mock_session):
     """
     Tests that upload_render_output makes the correct multipart POST request.
     """
     mocker.patch('os.path.exists', return_value=True)
     mocker.patch('builtins.open', mocker.mock_open(read_data=b'file_content'))
-    mock_post = mocker.patch('requests.post')
+    mock_post = mock_session.post
 
     result = api_handler.upload_render_output(10, "/path/to/file.png")
 
@@ -88,4 +129,17 @@ def test_upload_render_output(mocker):
     mock_post.assert_called_once()
     args, kwargs = mock_post.call_args
     assert args[0] == f"{config.MANAGER_API_URL}jobs/10/upload_output/"
-    assert 'files' in kwargs
\ No newline at end of file
+    assert 'files' in kwargs
+
+
+def test_session_is_created_once_and_reused(monkeypatch):
+    """
+    Tests that the manager API session is built lazily and shared by later calls.
+    """
+    monkeypatch.setattr(api_handler, '_session', None)
+
+    session = api_handler._get_session()
+
+    assert isinstance(session, requests.Session)
+    assert api_handler._get_session() is session
+    assert session.get_adapter(config.MANAGER_API_URL).max_retries.total == 3
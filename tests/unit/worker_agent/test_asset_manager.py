@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+# Copyright (c) 2025 Dryad and Naiad Software LLC
+#
+#
+# Created by Mario Estrella on 7/28/2025.
+# Dryad and Naiad Software LLC
+# mestrella@dryadandnaiad.com
+# Project: sethlans_reborn
+#
+# tests/unit/worker_agent/test_asset_manager.py
+"""
+Unit tests for the asset_manager module.
+"""
+
+from sethlans_worker_agent import asset_manager, config
+from sethlans_worker_agent.utils import file_operations
+
+ASSET_DATA = {'blend_file': 'http://manager/media/assets/scene.blend'}
+
+
+def test_ensure_asset_downloads_missing_asset(mocker, tmp_path):
+    """Tests that a missing asset is downloaded into the managed assets directory."""
+    mocker.patch.object(config, 'MANAGED_ASSETS_DIR', str(tmp_path))
+    expected_path = str(tmp_path / 'media' / 'assets' / 'scene.blend')
+    mock_download = mocker.patch.object(file_operations, 'download_file', return_value=expected_path)
+
+    assert asset_manager.ensure_asset_is_available(ASSET_DATA) == expected_path
+    mock_download.assert_called_once_with(ASSET_DATA['blend_file'], str(tmp_path / 'media' / 'assets'))
+
+
+def test_ensure_asset_handles_rejected_download(mocker, tmp_path):
+    """
+    Tests that a download rejected by download_file (returned None) is reported
+    as a failed download rather than an unexpected error.
+    """
+    mocker.patch.object(config, 'MANAGED_ASSETS_DIR', str(tmp_path))
+    mocker.patch.object(file_operations, 'download_file', return_value=None)
+    mock_logger = mocker.patch.object(asset_manager, 'logger')
+
+    assert asset_manager.ensure_asset_is_available(ASSET_DATA) is None
+
+    assert "did not match the expected size" in mock_logger.error.call_args.args[0]
+    mock_logger.critical.assert_not_called()
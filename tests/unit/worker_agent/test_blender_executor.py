@@ -11,310 +11,321 @@
 Unit tests for the blender_executor module.
 """
 
+import io
+import os
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import MagicMock
 
-# Import the module to be tested and its dependencies
-from sethlans_worker_agent import blender_executor, config, system_monitor
-from sethlans_worker_agent.tool_manager import tool_manager_instance
-
-
-@pytest.fixture
-def mock_exec_deps(mocker):
+# Import the module to be tested
+from sethlans_worker_agent import blender_executor
+
+
+def _assert_script(script, expected=(), forbidden=()):
+    """Checks all expected and forbidden script fragments, reporting every mismatch at once."""
+    missing = [line for line in expected if line not in script]
+    unexpected = [line for line in forbidden if line in script]
+    assert not missing, f"Missing from generated script: {missing}"
+    assert not unexpected, f"Unexpected in generated script: {unexpected}"
+
+
+def _running_process(poll, wait_code=0):
+    """Builds a plain Popen stand-in with empty binary pipes."""
+    return SimpleNamespace(pid=12345, stdout=io.BytesIO(), stderr=io.BytesIO(),
+                           poll=poll, wait=lambda timeout=None: wait_code)
+
+
+def _status_response(status):
+    """Builds a plain stand-in for the manager's job status response."""
+    return SimpleNamespace(status_code=200, json=lambda: {'status': status})
+
+
+def _job(**overrides):
+    """Builds a minimal job payload for execute_blender_job."""
+    job_data = {'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'blender_version': '4.5.0'}
+    job_data.update(overrides)
+    return job_data
+
+
+# Each case: (job_data, detected GPU backends, config overrides, assigned_gpu_index,
+#             expected script lines, forbidden script lines)
+SCRIPT_CASES = [
+    pytest.param(
+        _job(render_device='GPU', render_engine='CYCLES'), ['HIP', 'OPTIX'], {}, None,
+        ("bpy.context.scene.render.engine = 'CYCLES'",
+         "prefs.compute_device_type = 'OPTIX'",
+         "bpy.context.scene.cycles.device = 'GPU'"),
+        (),
+        id="gpu_job_picks_best_backend"),
+    pytest.param(
+        _job(render_device='CPU', render_engine='CYCLES'), ['CUDA'], {}, None,
+        ("bpy.context.scene.render.engine = 'CYCLES'",
+         "bpy.context.scene.cycles.device = 'CPU'"),
+        ("prefs.compute_device_type",),
+        id="cpu_job"),
+    pytest.param(
+        # An 'ANY' job without an assigned GPU on a GPU system is the CPU fallback case.
+        _job(render_device='ANY', render_engine='CYCLES'), ['CUDA'], {}, None,
+        ("bpy.context.scene.cycles.device = 'CPU'",),
+        ("prefs.compute_device_type", "bpy.context.scene.cycles.device = 'GPU'"),
+        id="any_job_cpu_fallback"),
+    pytest.param(
+        _job(render_device='CPU', render_engine='WORKBENCH'), ['CUDA'], {}, None,
+        ("bpy.context.scene.render.engine = 'WORKBENCH'",),
+        ("cycles.device",),
+        id="workbench_skips_cycles_config"),
+    pytest.param(
+        _job(render_device='GPU', render_engine='CYCLES'), ['CUDA'], {'FORCE_GPU_INDEX': '1'}, None,
+        ("target_gpu_index = 1",
+         "for device in prefs.devices: device.use = False",
+         "target_device.use = True"),
+        (),
+        id="force_gpu_index_isolates_single_gpu"),
+    pytest.param(
+        # The assigned index takes precedence over the global FORCE_GPU_INDEX.
+        _job(render_device='GPU', render_engine='CYCLES'), ['CUDA'], {'FORCE_GPU_INDEX': '0'}, 1,
+        ("target_gpu_index = 1",
+         "for device in prefs.devices: device.use = False",
+         "target_device.use = True"),
+        ("target_gpu_index = 0",),
+        id="gpu_index_override_wins"),
+]
+
+
+@pytest.mark.parametrize(
+    "job_data, detected_gpus, config_overrides, assigned_gpu_index, expected, forbidden", SCRIPT_CASES)
+def test_generated_script(mocker, mock_exec_deps, job_data, detected_gpus, config_overrides,
+                          assigned_gpu_index, expected, forbidden):
     """
-    A fixture to provide a standard, complex mock setup for subprocess.Popen,
-    tempfile, and other dependencies for testing execute_blender_job.
-    This fixture returns a dictionary of key mocks for tests to use.
+    Verifies the render configuration script written for each job/device combination.
     """
-    # Mock config directories
-    mocker.patch.object(config, 'WORKER_OUTPUT_DIR', '/mock/worker_output')
-    mocker.patch.object(config, 'WORKER_TEMP_DIR', '/mock/worker_temp')
-    # Mock config flags
-    mocker.patch.object(config, 'FORCE_CPU_ONLY', False)
-    mocker.patch.object(config, 'FORCE_GPU_ONLY', False)
-
-
-    # Mock subprocess management
-    mock_process = MagicMock()
-    mock_process.pid = 12345
-    mock_process.stdout.readline.side_effect = ['Blender render complete.\n', '']
-    mock_process.stderr.readline.side_effect = ['']
-    mock_process.poll.return_value = 0
-    mock_process.wait.return_value = 0
-    mock_popen = mocker.patch('subprocess.Popen', return_value=mock_process)
-    mocker.patch('time.sleep')
-
-    # Mock dependencies of execute_blender_job
-    mocker.patch('requests.get', return_value=MagicMock(status_code=200, json=lambda: {'status': 'RENDERING'}))
-    mocker.patch.object(tool_manager_instance, 'ensure_blender_version_available', return_value="/mock/tools/blender")
-    mocker.patch('os.path.exists', return_value=True)
-    mocker.patch('os.makedirs')
-    mocker.patch('sethlans_worker_agent.asset_manager.ensure_asset_is_available',
-                 return_value="/mock/local/scene.blend")
-
-    # Mock the system_monitor dependency
-    mock_gpu_details_data = [
-        {'name': 'Mock Physical GPU 0', 'type': 'OPTIX', 'id': 'GPU_ID_0'},
-        {'name': 'Mock Physical GPU 1', 'type': 'OPTIX', 'id': 'GPU_ID_1'}
-    ]
-    mocker.patch(
-        'sethlans_worker_agent.system_monitor.get_gpu_device_details',
-        return_value=mock_gpu_details_data
-    )
-    mocker.patch('sethlans_worker_agent.system_monitor.get_cpu_thread_count', return_value=16)
-
-
-    # Mock tempfile to capture script content
-    mock_write_method = MagicMock()
-    mock_temp_file_context = MagicMock()
-    mock_temp_file_context.__enter__.return_value.name = "/mock/worker_temp/fake_script.py"
-    mock_temp_file_context.__enter__.return_value.write = mock_write_method
-    mocker.patch('tempfile.NamedTemporaryFile', return_value=mock_temp_file_context)
-    mocker.patch('os.remove')
-
-    return {
-        "popen": mock_popen,
-        "process": mock_process,
-        "script_write": mock_write_method
-    }
-
-
-def test_command_always_includes_factory_startup(mock_exec_deps):
-    """
-    Verifies that --factory-startup is always used.
-    """
-    mock_popen = mock_exec_deps["popen"]
-    mock_job_data = {
-        'id': 1, 'asset': {'blend_file': 'http://a.blend'}, 'output_file_pattern': 'f',
-        'blender_version': '4.5.0'
-    }
+    mocker.patch('sethlans_worker_agent.system_monitor.detect_gpu_devices', return_value=detected_gpus)
+    mock_exec_deps["set_config"](**config_overrides)
 
-    blender_executor.execute_blender_job(mock_job_data)
+    blender_executor.execute_blender_job(job_data, assigned_gpu_index=assigned_gpu_index)
 
-    assert "--factory-startup" in mock_popen.call_args.args[0]
+    written_script = mock_exec_deps["script_write"].call_args.args[0]
+    _assert_script(written_script, expected, forbidden)
 
 
-def test_gpu_job_generates_correct_script(mocker, mock_exec_deps):
+@pytest.mark.parametrize("flag, expected_present", [
+    pytest.param("--factory-startup", True, id="always_factory_startup"),
+    # The render engine is set by the generated script, not the -E flag.
+    pytest.param("-E", False, id="omits_render_engine_flag"),
+])
+def test_command_flags(mock_exec_deps, flag, expected_present):
     """
-    Verifies that a GPU job generates a script to enable the best available GPU backend.
+    Verifies the presence or absence of fixed Blender command-line flags.
     """
-    mocker.patch('sethlans_worker_agent.system_monitor.detect_gpu_devices', return_value=['HIP', 'OPTIX'])
-    mock_write = mock_exec_deps["script_write"]
-
-    job_data = {
-        'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'render_device': 'GPU',
-        'render_engine': 'CYCLES', 'blender_version': '4.5.0'
-    }
-    blender_executor.execute_blender_job(job_data)
+    blender_executor.execute_blender_job(_job(render_engine='CYCLES'))
 
-    written_script = mock_write.call_args.args[0]
-    assert "bpy.context.scene.render.engine = 'CYCLES'" in written_script
-    assert "prefs.compute_device_type = 'OPTIX'" in written_script
-    assert "bpy.context.scene.cycles.device = 'GPU'" in written_script
+    called_command = mock_exec_deps["popen"].call_args.args[0]
+    assert (flag in called_command) == expected_present
 
 
-def test_cpu_job_generates_correct_script(mocker, mock_exec_deps):
-    """Verifies that a CPU job generates a script that sets the device to CPU."""
-    mocker.patch('sethlans_worker_agent.system_monitor.detect_gpu_devices', return_value=['CUDA'])
-    mock_write = mock_exec_deps["script_write"]
+# Each case: (CPU_THREADS, FORCE_CPU_ONLY, logical CPU threads, physical GPUs, expected --threads value)
+THREAD_CASES = [
+    pytest.param(2, False, 16, 2, "2", id="manual_override_precedes_automatic_logic"),
+    pytest.param(0, False, 16, 2, "14", id="automatic_limit_in_mixed_mode"),
+    pytest.param(0, True, 16, 2, None, id="not_applied_in_force_cpu_mode"),
+    pytest.param(0, False, 16, 0, None, id="not_applied_if_no_gpus"),
+    pytest.param(0, False, 4, 5, "1", id="automatic_limit_clamps_at_one"),
+]
 
-    job_data = {
-        'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'render_device': 'CPU',
-        'render_engine': 'CYCLES', 'blender_version': '4.5.0'
-    }
-    blender_executor.execute_blender_job(job_data)
 
-    written_script = mock_write.call_args.args[0]
-    assert "bpy.context.scene.render.engine = 'CYCLES'" in written_script
-    assert "bpy.context.scene.cycles.device = 'CPU'" in written_script
-    assert "prefs.compute_device_type" not in written_script
-
-
-def test_any_job_on_gpu_system_forces_cpu_when_fallback_is_true(mocker, mock_exec_deps):
-    """
-    Verifies that an 'ANY' job on a GPU system generates a CPU-only script
-    when the job processor has determined it's a CPU fallback case.
+@pytest.mark.parametrize("cpu_threads, force_cpu_only, cpu_count, num_gpus, expected_threads", THREAD_CASES)
+def test_cpu_thread_limit(mocker, mock_exec_deps, cpu_threads, force_cpu_only, cpu_count, num_gpus,
+                          expected_threads):
     """
-    # Arrange: Simulate a GPU-capable system
-    mocker.patch('sethlans_worker_agent.system_monitor.detect_gpu_devices', return_value=['CUDA'])
-    mocker.patch('sethlans_worker_agent.system_monitor.get_gpu_device_details', return_value=[{'name': 'GPU'}])
-    mock_write = mock_exec_deps["script_write"]
-    job_data = {
-        'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'render_device': 'ANY',
-        'render_engine': 'CYCLES', 'blender_version': '4.5.0'
-    }
-
-    # Act: Execute the job with assigned_gpu_index=None, simulating the fallback scenario
-    blender_executor.execute_blender_job(job_data, assigned_gpu_index=None)
-
-    # Assert: The generated script must configure for CPU and not GPU
-    written_script = mock_write.call_args.args[0]
-    assert "bpy.context.scene.cycles.device = 'CPU'" in written_script
-    assert "prefs.compute_device_type" not in written_script
-    assert "bpy.context.scene.cycles.device = 'GPU'" not in written_script
-
-
-def test_workbench_job_skips_cycles_config(mocker, mock_exec_deps):
+    Tests the --threads flag for CPU jobs: a manual CPU_THREADS setting wins,
+    otherwise mixed-mode workers reserve one thread per GPU (minimum 1), and no
+    limit is applied in FORCE_CPU_ONLY mode or when no GPUs are present.
     """
-    Verifies that a non-Cycles job does not attempt to configure Cycles devices.
-    """
-    mocker.patch('sethlans_worker_agent.system_monitor.detect_gpu_devices', return_value=['CUDA'])
-    mock_write = mock_exec_deps["script_write"]
+    mock_exec_deps["set_config"](CPU_THREADS=cpu_threads, FORCE_CPU_ONLY=force_cpu_only)
+    mocker.patch('sethlans_worker_agent.system_monitor.get_cpu_thread_count', return_value=cpu_count)
+    mocker.patch('sethlans_worker_agent.system_monitor.get_gpu_device_details', return_value=[{}] * num_gpus)
+
+    blender_executor.execute_blender_job(_job(render_device='CPU'))
 
-    job_data = {
-        'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'render_device': 'CPU',
-        'render_engine': 'WORKBENCH', 'blender_version': '4.5.0'
-    }
-    blender_executor.execute_blender_job(job_data)
+    called_command = mock_exec_deps["popen"].call_args.args[0]
+    if expected_threads is None:
+        assert "--threads" not in called_command
+    else:
+        assert called_command[called_command.index("--threads") + 1] == expected_threads
 
-    written_script = mock_write.call_args.args[0]
-    assert "bpy.context.scene.render.engine = 'WORKBENCH'" in written_script
-    assert "cycles.device" not in written_script
 
+@pytest.mark.parametrize("pattern, frame, expected", [
+    pytest.param("out/frame_####", 7, "out/frame_0007.png", id="four_hashes"),
+    pytest.param("out/frame_###", 12, "out/frame_012.png", id="three_hashes"),
+    pytest.param("out/#_tile_##", 3, "out/#_tile_03.png", id="last_run_only"),
+    pytest.param("out/frame_", 5, "out/frame_0005.png", id="no_hashes_appends_frame"),
+])
+def test_frame_output_path(pattern, frame, expected):
+    """Tests that the output file path is resolved like Blender pads frame numbers."""
+    assert blender_executor._frame_output_path(pattern, frame) == expected
 
-def test_command_omits_render_engine_flag(mock_exec_deps):
+
+def test_asset_and_blender_are_fetched_concurrently(mocker, mock_exec_deps):
     """
-    Tests that the -E flag is no longer used, as it's handled by the script.
+    Tests that the asset and the Blender install are prepared at the same time,
+    and that a missing asset is still reported first.
     """
-    mock_popen = mock_exec_deps["popen"]
-    job_data = {
-        'id': 1, 'asset': {}, 'output_file_pattern': 'f',
-        'render_engine': 'CYCLES', 'blender_version': '4.5.0'
-    }
+    both_started = threading.Barrier(2, timeout=5)
 
-    blender_executor.execute_blender_job(job_data)
+    def ensure_asset(asset):
+        both_started.wait()
+        return None
 
-    called_command = mock_popen.call_args.args[0]
-    assert "-E" not in called_command
+    def ensure_blender(version):
+        both_started.wait()
+        return "/mock/tools/blender"
 
+    mocker.patch('sethlans_worker_agent.asset_manager.ensure_asset_is_available', side_effect=ensure_asset)
+    mocker.patch.object(blender_executor.tool_manager_instance, 'ensure_blender_version_available',
+                        side_effect=ensure_blender)
 
-def test_gpu_job_isolates_single_gpu_when_index_is_set(mocker, mock_exec_deps):
-    """
-    Verifies that setting FORCE_GPU_INDEX generates a script that disables all
-    devices first, then enables only the specified GPU.
-    """
-    # Arrange
-    mocker.patch.object(config, 'FORCE_GPU_INDEX', '1') # Target the second GPU (index 1)
-    mocker.patch('sethlans_worker_agent.system_monitor.detect_gpu_devices', return_value=['CUDA'])
-    mock_write = mock_exec_deps["script_write"]
-    job_data = {
-        'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'render_device': 'GPU',
-        'render_engine': 'CYCLES', 'blender_version': '4.5.0'
-    }
-
-    # Act
-    blender_executor.execute_blender_job(job_data)
-
-    # Assert
-    written_script = mock_write.call_args.args[0]
-    assert "target_gpu_index = 1" in written_script
-    # This logic ensures other GPUs are disabled
-    assert "for device in prefs.devices: device.use = False" in written_script
-    assert "target_device.use = True" in written_script
-
-
-def test_render_script_generation_with_gpu_index_override(mocker, mock_exec_deps):
+    success, *_, error_message, _ = blender_executor.execute_blender_job(_job())
+
+    assert success is False
+    assert error_message == "Failed to download or find the required .blend file asset."
+    mock_exec_deps["popen"].assert_not_called()
+
+
+def test_stream_reader_splits_lines_across_chunks():
     """
-    Verifies that the `gpu_index_override` parameter correctly generates a script
-    to isolate a single GPU, taking precedence over FORCE_GPU_INDEX.
+    Tests that bulk reads are reassembled into lines, including lines and
+    multi-byte characters split across chunk boundaries and CRLF endings.
     """
-    # Arrange: Set both the global force flag and the override. Override should win.
-    mocker.patch.object(config, 'FORCE_GPU_INDEX', '0')
-    mocker.patch('sethlans_worker_agent.system_monitor.detect_gpu_devices', return_value=['CUDA'])
-    mock_write = mock_exec_deps["script_write"]
-    job_data = {'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'render_device': 'GPU',
-                'render_engine': 'CYCLES', 'blender_version': '4.5.0'}
+    stream = MagicMock()
+    stream.read1.side_effect = [b"Fra:1 Mem:12M | Ren", b"dering 1 / 2\r\nSaved: 'caf\xc3", b"\xa9.png'\n", b""]
+    lines = []
 
-    # Act: Pass the override index to the function
-    blender_executor.execute_blender_job(job_data, assigned_gpu_index=1)
+    blender_executor._stream_reader(stream, lines)
 
-    # Assert
-    written_script = mock_write.call_args.args[0]
-    assert "target_gpu_index = 1" in written_script # Asserts the override was used
-    assert "for device in prefs.devices: device.use = False" in written_script
-    assert "target_device.use = True" in written_script
-    assert "target_gpu_index = 0" not in written_script # Asserts the global flag was ignored
+    assert lines == ["Fra:1 Mem:12M | Rendering 1 / 2\n", "Saved: 'caf\u00e9.png'\n"]
+    stream.close.assert_called_once()
 
 
-def test_manual_override_precedes_automatic_logic(mocker, mock_exec_deps):
+@pytest.mark.parametrize("max_bytes, expected", [
+    pytest.param(31, ["warning 3\n", "error: out of memory\n"], id="limit_on_line_boundary"),
+    pytest.param(30, ["error: out of memory\n"], id="drops_partial_first_line"),
+])
+def test_stream_reader_keeps_only_the_tail(max_bytes, expected):
     """
-    Tests that a manual CPU_THREADS setting is used and prevents the
-    automatic calculation from running.
+    Tests that a byte limit keeps only the last complete lines of the stream.
     """
-    mocker.patch.object(config, 'CPU_THREADS', 2) # Manual override
-    mock_popen = mock_exec_deps["popen"]
+    stream = MagicMock()
+    stream.read1.side_effect = [b"warning 1\nwarning 2\n", b"warning 3\nerror: out of memory\n", b""]
+    lines = []
 
-    job_data = {'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'render_device': 'CPU', 'blender_version': '4.5.0'}
-    blender_executor.execute_blender_job(job_data)
+    blender_executor._stream_reader(stream, lines, max_bytes=max_bytes)
 
-    called_command = mock_popen.call_args.args[0]
-    assert "--threads" in called_command
-    assert "2" in called_command
+    assert lines == expected
 
 
-def test_automatic_thread_limit_in_mixed_mode(mocker, mock_exec_deps):
+def test_cancellation_kills_process_tree(mocker, mock_exec_deps):
     """
-    Tests the automatic thread calculation in a standard mixed-mode worker
-    (CPU+GPU capable, no force flags).
+    Tests that a CANCELED status from the manager kills Blender and its children
+    and reports the job as canceled.
     """
-    mocker.patch.object(config, 'CPU_THREADS', 0) # Ensure no manual override
-    mocker.patch('sethlans_worker_agent.system_monitor.get_cpu_thread_count', return_value=16)
-    mocker.patch('sethlans_worker_agent.system_monitor.get_gpu_device_details', return_value=[{}, {}]) # 2 GPUs
-    mock_popen = mock_exec_deps["popen"]
-    job_data = {'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'render_device': 'CPU', 'blender_version': '4.5.0'}
+    running_process = _running_process(lambda: None, wait_code=-9)
+    mocker.patch('subprocess.Popen', return_value=running_process)
+    mocker.patch('sethlans_worker_agent.api_handler.fetch_job', return_value=_status_response('CANCELED'))
+    mock_children = [MagicMock(), MagicMock()]
+    mock_process_cls = mocker.patch('psutil.Process')
+    mock_parent = mock_process_cls.return_value
+    mock_parent.children.return_value = mock_children
+    # A child that exits on its own before it is killed must not abort the cancellation.
+    mock_children[0].kill.side_effect = blender_executor.psutil.NoSuchProcess(23456)
+    mock_wait_procs = mocker.patch('psutil.wait_procs')
+
+    success, was_canceled, _, _, error_message, _ = blender_executor.execute_blender_job(_job())
+
+    assert (success, was_canceled) == (False, True)
+    assert error_message == "Job was canceled by user request."
+    mock_process_cls.assert_called_once_with(12345)
+    for proc in (*mock_children, mock_parent):
+        proc.kill.assert_called_once()
+    mock_wait_procs.assert_called_once_with([*mock_children, mock_parent],
+                                            timeout=blender_executor.KILL_WAIT_TIMEOUT_SECONDS)
+
+
+def test_cancel_check_interval_backs_off(mocker, mock_exec_deps):
+    """
+    Tests that the wait between cancellation checks doubles on each iteration
+    up to MAX_CANCEL_CHECK_INTERVAL_SECONDS.
+    """
+    poll_results = iter([None] * 5 + [0])
+    running_process = _running_process(lambda: next(poll_results))
+    mocker.patch('subprocess.Popen', return_value=running_process)
+    mock_wait = mocker.patch.object(blender_executor, '_wait_for_exit')
 
-    blender_executor.execute_blender_job(job_data)
+    blender_executor.execute_blender_job(_job())
 
-    called_command = mock_popen.call_args.args[0]
-    # Expected: 16 total - 2 for GPUs = 14
-    assert "--threads" in called_command
-    assert "14" in called_command
+    assert [c.args[1] for c in mock_wait.call_args_list] == [2, 4, 8, 16, 16]
 
 
-def test_automatic_thread_limit_is_not_applied_in_force_cpu_mode(mocker, mock_exec_deps):
+def test_failure_details_keep_the_end_of_stderr(mocker, mock_exec_deps):
     """
-    Tests that automatic logic is skipped if FORCE_CPU_ONLY is true.
+    Tests that a failed render reports the last part of STDERR, where Blender
+    prints the fatal error, rather than the start of a long log.
     """
-    mocker.patch.object(config, 'CPU_THREADS', 0)
-    mocker.patch.object(config, 'FORCE_CPU_ONLY', True) # Force mode
-    mock_popen = mock_exec_deps["popen"]
-    job_data = {'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'render_device': 'CPU', 'blender_version': '4.5.0'}
+    running_process = _running_process(lambda: 1, wait_code=1)
+    running_process.stderr = io.BytesIO(b"Warning: noisy preamble\n" * 100 + b"Error: Out of GPU memory\n")
+    mocker.patch('subprocess.Popen', return_value=running_process)
+
+    success, _, _, _, error_message, _ = blender_executor.execute_blender_job(_job())
+
+    assert success is False
+    assert error_message.startswith("Blender exited with code 1. Details: ")
+    assert error_message.endswith("Error: Out of GPU memory")
+
 
-    blender_executor.execute_blender_job(job_data)
+def test_pid_alive_tracks_process_lifetime():
+    """Tests that _pid_alive reports a live process and a reaped one correctly."""
+    assert blender_executor._pid_alive(os.getpid()) is True
 
-    called_command = mock_popen.call_args.args[0]
-    assert "--threads" not in called_command
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    assert blender_executor._pid_alive(process.pid) is False
 
 
-def test_automatic_thread_limit_is_not_applied_if_no_gpus(mocker, mock_exec_deps):
+def test_status_poll_error_stops_when_process_is_gone(mocker, mock_exec_deps):
     """
-    Tests that automatic logic is skipped on a CPU-only worker (no GPUs detected).
+    Tests that the job loop stops waiting once the manager is unreachable and
+    the Blender process no longer exists.
     """
-    mocker.patch.object(config, 'CPU_THREADS', 0)
-    mocker.patch('sethlans_worker_agent.system_monitor.get_gpu_device_details', return_value=[]) # No GPUs
-    mock_popen = mock_exec_deps["popen"]
-    job_data = {'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'render_device': 'CPU', 'blender_version': '4.5.0'}
+    running_process = _running_process(lambda: None, wait_code=1)
+    mocker.patch('subprocess.Popen', return_value=running_process)
+    mocker.patch('sethlans_worker_agent.api_handler.fetch_job',
+                 side_effect=blender_executor.requests.exceptions.ConnectionError)
+    mock_pid_alive = mocker.patch.object(blender_executor, '_pid_alive', side_effect=[True, True, False])
+    mocker.patch.object(blender_executor, '_wait_for_exit')
 
-    blender_executor.execute_blender_job(job_data)
+    success, was_canceled, *_ = blender_executor.execute_blender_job(_job())
 
-    called_command = mock_popen.call_args.args[0]
-    assert "--threads" not in called_command
+    assert (success, was_canceled) == (False, False)
+    assert mock_pid_alive.call_count == 3
 
 
-def test_automatic_thread_limit_clamps_at_one(mocker, mock_exec_deps):
+@pytest.mark.skipif(not hasattr(os, 'pidfd_open'), reason="pidfd_open is Linux-only")
+def test_wait_for_exit_wakes_on_exit_with_pidfd():
     """
-    Tests that the calculation result is clamped to a minimum of 1 if there are
-    more GPUs than CPU threads.
+    Tests that waiting on a pidfd returns as soon as the process exits rather
+    than after the full timeout.
     """
-    mocker.patch.object(config, 'CPU_THREADS', 0)
-    mocker.patch('sethlans_worker_agent.system_monitor.get_cpu_thread_count', return_value=4)
-    mocker.patch('sethlans_worker_agent.system_monitor.get_gpu_device_details', return_value=[{}, {}, {}, {}, {}]) # 5 GPUs
-    mock_popen = mock_exec_deps["popen"]
-    job_data = {'id': 1, 'asset': {}, 'output_file_pattern': 'f', 'render_device': 'CPU', 'blender_version': '4.5.0'}
-
-    blender_executor.execute_blender_job(job_data)
-
-    called_command = mock_popen.call_args.args[0]
-    # Expected: max(1, 4 - 5) = 1
-    assert "--threads" in called_command
-    assert "1" in called_command
\ No newline at end of file
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.2)"])
+    pidfd = blender_executor._open_pidfd(process.pid)
+    assert pidfd is not None
+    try:
+        started = time.monotonic()
+        blender_executor._wait_for_exit(process, 30, pidfd)
+        assert time.monotonic() - started < 10
+    finally:
+        os.close(pidfd)
+        process.wait()
@@ -9,13 +9,24 @@
 #
 import pytest
 import requests
+from types import SimpleNamespace
 from unittest.mock import MagicMock, call
+from urllib.parse import urljoin
+
+from selectolax.lexbor import LexborHTMLParser
 
 # Import the module to be tested and its dependency
 from sethlans_worker_agent.utils import blender_release_parser
 from sethlans_worker_agent.utils import hash_parser
 
 # --- Mock HTML Data ---
+MOCK_MAIN_PAGE_HTML = """
+<html><body>
+    <a href="Blender3.6/">Blender3.6/</a>
+    <a href="Blender4.1/">Blender4.1/</a>
+</body></html>
+"""
+
 MOCK_MAIN_PAGE_HTML_MULTI_PATCH = """
 <html><body>
     <a href="Blender4.1/">Blender4.1/</a>
@@ -38,26 +49,67 @@ MOCK_4_2_PAGE_HTML = """
 </body></html>
 """
 
-def test_get_blender_releases_filters_for_latest_patch(mocker):
+
+def _response(html):
+    """Builds a read-only stand-in for a successful requests.Response."""
+    return SimpleNamespace(content=html, raise_for_status=lambda: None)
+
+
+# Canned responses, built once and shared by every scrape in this module.
+_MAIN_RESPONSE = _response(MOCK_MAIN_PAGE_HTML)
+_MAIN_RESPONSE_MULTI_PATCH = _response(MOCK_MAIN_PAGE_HTML_MULTI_PATCH)
+_4_1_RESPONSE = _response(MOCK_4_1_PAGE_HTML)
+_4_2_RESPONSE = _response(MOCK_4_2_PAGE_HTML)
+_EMPTY_RESPONSE = _response("")
+
+_EXPECTED_VERSION_URLS = frozenset(
+    urljoin(blender_release_parser.BASE_URL, suffix)
+    for suffix in ("Blender4.0/", "Blender4.1/", "Blender4.2/", "Blender4.3/",
+                   "Blender4.4/", "Blender4.5/", "Blender5.0/")
+)
+_FORBIDDEN_VERSION_URLS = frozenset(
+    urljoin(blender_release_parser.BASE_URL, suffix)
+    for suffix in ("Blender1.0/", "Blender2.93/", "Blender3.6/", "OtherDir/")
+)
+
+def test_parse_major_version_directories_filters_below_4_x(dummy_main_tree):
+    """
+    Tests that only the 4.0+ major version directories are returned from the
+    release index, and that unrelated directories are ignored.
+    """
+    major_version_urls = set(blender_release_parser.parse_major_version_directories(dummy_main_tree))
+
+    assert major_version_urls == _EXPECTED_VERSION_URLS
+    assert _FORBIDDEN_VERSION_URLS.isdisjoint(major_version_urls)
+
+
+def test_parse_major_version_directories_accepts_response_bytes(dummy_main_releases_html, dummy_main_tree):
+    """
+    Tests that a page parsed from raw response bytes, as the scraper does,
+    yields the same directories as one parsed from text.
+    """
+    tree = LexborHTMLParser(dummy_main_releases_html.encode('utf-8'))
+    # The function is a generator, so materialise both sides before comparing.
+    assert (list(blender_release_parser.parse_major_version_directories(tree)) ==
+            list(blender_release_parser.parse_major_version_directories(dummy_main_tree)))
+
+
+@pytest.mark.parametrize("main_response, expected_versions", [
+    pytest.param(_MAIN_RESPONSE, {"4.1.1"}, id="single_series"),
+    pytest.param(_MAIN_RESPONSE_MULTI_PATCH, {"4.1.1", "4.2.0"}, id="multiple_series"),
+])
+def test_get_blender_releases_filters_for_latest_patch(mocker, main_response, expected_versions):
     """
     Tests that the scraper correctly identifies multiple patch versions
     and filters the final result to include only the latest one for each series.
     """
     # Arrange
-    mock_main_response = MagicMock(content=MOCK_MAIN_PAGE_HTML_MULTI_PATCH)
-    mock_4_1_response = MagicMock(content=MOCK_4_1_PAGE_HTML)
-    mock_4_2_response = MagicMock(content=MOCK_4_2_PAGE_HTML)
+    responses = {'/release/': main_response, '/Blender4.1/': _4_1_RESPONSE, '/Blender4.2/': _4_2_RESPONSE}
 
     def get_side_effect(url, timeout):
-        if url.endswith('/release/'):
-            return mock_main_response
-        if url.endswith('/Blender4.1/'):
-            return mock_4_1_response
-        if url.endswith('/Blender4.2/'):
-            return mock_4_2_response
-        return MagicMock() # Default mock for any other calls
-
-    mocker.patch('requests.get', side_effect=get_side_effect)
+        return responses.get(url[url.rindex('/', 0, -1):], _EMPTY_RESPONSE)
+
+    mocker.patch.object(blender_release_parser, '_session', MagicMock(get=MagicMock(side_effect=get_side_effect)))
     mocker.patch.object(
         hash_parser,
         'get_all_hashes_from_url',
@@ -71,10 +123,26 @@ def test_get_blender_releases_filters_for_latest_patch(mocker):
     releases = blender_release_parser.get_blender_releases()
 
     # Assert
-    assert "4.1.0" not in releases  # Should be filtered out
-    assert "4.1.1" in releases      # Should be the latest for 4.1
-    assert "4.2.0" in releases      # Should be the latest for 4.2
-    assert len(releases) == 2
+    assert set(releases) == expected_versions  # 4.1.0 is superseded by 4.1.1
 
     release_411 = releases["4.1.1"]["windows-x64"]
-    assert "blender-4.1.1-windows-x64.zip" in release_411["url"]
\ No newline at end of file
+    assert "blender-4.1.1-windows-x64.zip" in release_411["url"]
+    assert release_411["sha256"] == "hash411"
+
+
+def test_clear_page_cache_removes_cache_file_and_session(mocker, tmp_path):
+    """
+    Tests that clearing the page cache closes the shared session and deletes
+    the SQLite file so the next scrape goes back to the download site.
+    """
+    cache_file = tmp_path / 'blender_release_pages.sqlite'
+    cache_file.write_bytes(b'')
+    session = MagicMock()
+    mocker.patch.object(blender_release_parser, 'PAGE_CACHE_PATH', cache_file)
+    mocker.patch.object(blender_release_parser, '_session', session)
+
+    blender_release_parser.clear_page_cache()
+
+    session.close.assert_called_once()
+    assert blender_release_parser._session is None
+    assert not cache_file.exists()
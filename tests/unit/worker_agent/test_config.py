@@ -12,25 +12,26 @@
 Unit tests for the worker agent's configuration loading module.
 """
 
+import configparser
+
 import pytest
-from unittest.mock import MagicMock
 
 # Module to be tested
 from sethlans_worker_agent import config
 
 
 @pytest.fixture
-def mock_config_dependencies(mocker):
-    """Mocks os.getenv and configparser for testing the config helper."""
-    mock_getenv = mocker.patch('os.getenv')
-    mock_config_parser = MagicMock()
-    mocker.patch('configparser.ConfigParser', return_value=mock_config_parser)
-    # Re-initialize the module-level parser to use our mock
-    config.config_parser = mock_config_parser
+def mock_config_dependencies(mocker, monkeypatch):
+    """
+    Provides a fresh os.getenv mock and an empty .ini cache to each test.
 
+    Tests populate the "ini" dictionary as {section: {option: value}}.
+    """
+    ini_cache = {}
+    monkeypatch.setattr(config, '_INI_CACHE', ini_cache)
     return {
-        "getenv": mock_getenv,
-        "parser": mock_config_parser
+        "getenv": mocker.patch('os.getenv'),
+        "ini": ini_cache
     }
 
 
@@ -40,7 +41,6 @@ def test_get_config_value_uses_default(mock_config_dependencies):
     """
     # Arrange
     mock_config_dependencies["getenv"].return_value = None
-    mock_config_dependencies["parser"].has_option.return_value = False
 
     # Act
     result = config.get_config_value('manager', 'port', '7075', is_int=True)
@@ -55,15 +55,13 @@ def test_get_config_value_uses_ini_file(mock_config_dependencies):
     """
     # Arrange
     mock_config_dependencies["getenv"].return_value = None
-    mock_config_dependencies["parser"].has_option.return_value = True
-    mock_config_dependencies["parser"].getint.return_value = 8080
+    mock_config_dependencies["ini"]['manager'] = {'port': '8080'}
 
     # Act
     result = config.get_config_value('manager', 'port', '7075', is_int=True)
 
     # Assert
     assert result == 8080
-    mock_config_dependencies["parser"].getint.assert_called_once_with('manager', 'port')
 
 
 def test_get_config_value_env_var_overrides_ini(mock_config_dependencies):
@@ -72,8 +70,7 @@ def test_get_config_value_env_var_overrides_ini(mock_config_dependencies):
     """
     # Arrange
     mock_config_dependencies["getenv"].return_value = '9000' # Env var is set
-    mock_config_dependencies["parser"].has_option.return_value = True
-    mock_config_dependencies["parser"].getint.return_value = 8080 # Ini is also set
+    mock_config_dependencies["ini"]['manager'] = {'port': '8080'} # Ini is also set
 
     # Act
     result = config.get_config_value('manager', 'port', '7075', is_int=True)
@@ -81,7 +78,6 @@ def test_get_config_value_env_var_overrides_ini(mock_config_dependencies):
     # Assert
     assert result == 9000
     mock_config_dependencies["getenv"].assert_called_once_with('SETHLANS_MANAGER_PORT')
-    mock_config_dependencies["parser"].getint.assert_not_called()
 
 
 def test_get_config_value_handles_string_value(mock_config_dependencies):
@@ -90,11 +86,49 @@ def test_get_config_value_handles_string_value(mock_config_dependencies):
     """
     # Arrange
     mock_config_dependencies["getenv"].return_value = None
-    mock_config_dependencies["parser"].has_option.return_value = True
-    mock_config_dependencies["parser"].get.return_value = "testhost"
+    mock_config_dependencies["ini"]['manager'] = {'host': 'testhost'}
 
     # Act
     result = config.get_config_value('manager', 'host', '127.0.0.1', is_int=False)
 
     # Assert
-    assert result == "testhost"
\ No newline at end of file
+    assert result == "testhost"
+
+
+def test_get_config_value_ini_lookup_ignores_key_case(mock_config_dependencies):
+    """
+    Tests that keys are matched case-insensitively, as ConfigParser stores
+    option names lowercased.
+    """
+    # Arrange
+    mock_config_dependencies["getenv"].return_value = None
+    mock_config_dependencies["ini"]['worker'] = {'cpu_threads': '4'}
+
+    # Act
+    result = config.get_config_value('worker', 'CPU_THREADS', 0, is_int=True)
+
+    # Assert
+    assert result == 4
+
+
+def test_get_config_value_interpolates_only_options_that_are_read(mock_config_dependencies, monkeypatch):
+    """
+    Tests that the cache built from a real ConfigParser tolerates a bare '%'
+    in an unread option and still interpolates the option being read.
+    """
+    # Arrange
+    mock_config_dependencies["getenv"].return_value = None
+    parser = configparser.ConfigParser()
+    parser.read_string(
+        "[worker]\n"
+        "log_dir = %APPDATA%\\sethlans\n"
+        "base = /srv/sethlans\n"
+        "output_dir = %(base)s/output\n"
+        "polling_interval = 7\n"
+    )
+    monkeypatch.setattr(config, 'config_parser', parser)
+    monkeypatch.setattr(config, '_INI_CACHE', config._build_ini_cache(parser))
+
+    # Act / Assert
+    assert config.get_config_value('worker', 'polling_interval', 5, is_int=True) == 7
+    assert config.get_config_value('worker', 'output_dir', '') == "/srv/sethlans/output"
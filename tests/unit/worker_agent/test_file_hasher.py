@@ -10,50 +10,38 @@
 #
 
 import pytest
-import os
-import tempfile
-from sethlans_worker_agent.utils.file_hasher import calculate_file_sha256
+from sethlans_worker_agent.utils import file_hasher
+from sethlans_worker_agent.utils.file_hasher import calculate_file_sha256, calculate_files_sha256
 
 
-def test_calculate_file_sha256_basic():
+@pytest.fixture(autouse=True)
+def clear_hash_cache():
+    """Ensures every test starts and ends with an empty hash cache."""
+    file_hasher._hash_cache.clear()
+    yield
+    file_hasher._hash_cache.clear()
+
+
+def test_calculate_file_sha256_basic(hello_sethlans_file):
     """
     Tests SHA256 hash calculation for a basic text file.
     The file is written in binary mode to ensure consistent hashing across OS.
     """
-    # Create a temporary file with known content (in bytes)
-    with tempfile.NamedTemporaryFile(mode='wb+', delete=False) as tmp_file:  # Changed mode to 'wb+'
-        tmp_file.write(b"Hello, Sethlans Reborn!")  # Write bytes
-        tmp_file_path = tmp_file.name
-
-    try:
-        calculated_hash = calculate_file_sha256(tmp_file_path)
+    calculated_hash = calculate_file_sha256(hello_sethlans_file)
 
-        # Corrected expected hash for b"Hello, Sethlans Reborn!"
-        expected_hash = "1d68f2316c6a7951f74bd2a3f9c3aab5c2c31b8ab2ba6ac7a2efe08986184e97"
+    # Corrected expected hash for b"Hello, Sethlans Reborn!"
+    expected_hash = "1d68f2316c6a7951f74bd2a3f9c3aab5c2c31b8ab2ba6ac7a2efe08986184e97"
+    assert calculated_hash == expected_hash
 
-        assert calculated_hash == expected_hash
-        print(f"\n[UNIT TEST] SHA256 calculation basic test passed for: {tmp_file_path}")
-        print(f"  Calculated: {calculated_hash}")
-        print(f"  Expected:   {expected_hash}")
-    finally:
-        os.remove(tmp_file_path)
 
-
-def test_calculate_file_sha256_empty_file():
+def test_calculate_file_sha256_empty_file(empty_file):
     """
     Tests SHA256 hash calculation for an empty file.
     """
-    with tempfile.NamedTemporaryFile(mode='wb+', delete=False) as tmp_file:  # Changed mode to 'wb+'
-        tmp_file_path = tmp_file.name
-
-    try:
-        calculated_hash = calculate_file_sha256(tmp_file_path)
-        # Expected hash for an empty byte string
-        expected_hash = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
-        assert calculated_hash == expected_hash
-        print(f"\n[UNIT TEST] SHA256 calculation empty file test passed for: {tmp_file_path}")
-    finally:
-        os.remove(tmp_file_path)
+    calculated_hash = calculate_file_sha256(empty_file)
+    # Expected hash for an empty byte string
+    expected_hash = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+    assert calculated_hash == expected_hash
 
 
 def test_calculate_file_sha256_non_existent_file():
@@ -63,4 +51,48 @@ def test_calculate_file_sha256_non_existent_file():
     non_existent_path = "non_existent_file_12345.txt"
     calculated_hash = calculate_file_sha256(non_existent_path)
     assert calculated_hash is None
-    print(f"\n[UNIT TEST] SHA256 calculation non-existent file test passed.")
+
+
+def test_calculate_file_sha256_reuses_cached_hash(mocker, hello_sethlans_file):
+    """
+    Tests that hashing an unchanged file a second time is served from the
+    cache without re-opening the file.
+    """
+    first_hash = calculate_file_sha256(hello_sethlans_file)
+    mock_open = mocker.patch('builtins.open')
+
+    second_hash = calculate_file_sha256(hello_sethlans_file)
+
+    assert second_hash == first_hash
+    mock_open.assert_not_called()
+
+
+def test_calculate_file_sha256_rehashes_modified_file(tmp_path):
+    """
+    Tests that a file whose contents change is hashed again rather than
+    returning the stale cached value.
+    """
+    file_path = tmp_path / "changing.bin"
+    file_path.write_bytes(b"first")
+    first_hash = calculate_file_sha256(str(file_path))
+
+    file_path.write_bytes(b"second version")
+    second_hash = calculate_file_sha256(str(file_path))
+
+    assert second_hash != first_hash
+
+
+def test_calculate_files_sha256_hashes_each_file(hello_sethlans_file, empty_file):
+    """
+    Tests that the batch API returns a hash for every path, with None for
+    files that could not be hashed.
+    """
+    missing_path = "non_existent_file_12345.txt"
+
+    hashes = calculate_files_sha256([hello_sethlans_file, empty_file, missing_path])
+
+    assert hashes == {
+        hello_sethlans_file: "1d68f2316c6a7951f74bd2a3f9c3aab5c2c31b8ab2ba6ac7a2efe08986184e97",
+        empty_file: "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855",
+        missing_path: None,
+    }
@@ -12,6 +12,11 @@ import requests
 import tempfile
 import os
 import hashlib
+import io
+import shutil
+import subprocess
+import tarfile
+import urllib3
 from unittest.mock import MagicMock
 
 # Import the functions to be tested
@@ -23,19 +28,19 @@ def test_download_file(mocker):
     # Arrange
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
-    mock_response.headers.get.return_value = 12  # content-length
-    mock_response.iter_content.return_value = [b"dummy", b" content"]
+    mock_response.headers = {'content-length': '13'}
+    mock_response.raw = io.BytesIO(b"dummy content")
 
     # This mock correctly handles the 'with requests.get(...) as r:' syntax
     mock_get_patch = mocker.patch('requests.get')
     mock_get_patch.return_value.__enter__.return_value = mock_response
 
     m_open = mocker.patch('builtins.open', mocker.mock_open())
-    # ** THE FIX IS HERE **
     # Configure the mock file handle that open() will return, without calling open() itself.
     m_open.return_value.write.side_effect = lambda chunk: len(chunk)
 
     mocker.patch('tqdm.tqdm')  # Mock tqdm to prevent console output
+    mocker.patch('os.path.getsize', return_value=13)
 
     # Act
     dest_folder = "/tmp/test"
@@ -45,9 +50,72 @@ def test_download_file(mocker):
     assert download_path == os.path.join(dest_folder, "file.zip")
     m_open.assert_called_once_with(os.path.join(dest_folder, "file.zip"), 'wb')
 
-    # Assert on the file handle that open returns
+    # Without a hash to check, the raw stream is copied through in large blocks.
     handle = m_open.return_value
-    assert handle.write.call_count == 2
+    assert b"".join(c.args[0] for c in handle.write.call_args_list) == b"dummy content"
+    mock_response.iter_content.assert_not_called()
+
+
+def _mock_streamed_download(mocker, chunks):
+    """Patches requests.get to stream the given chunks and silences tqdm."""
+    mock_response = MagicMock()
+    mock_response.headers.get.return_value = sum(len(chunk) for chunk in chunks)
+    mock_response.iter_content.return_value = chunks
+    mocker.patch('requests.get').return_value.__enter__.return_value = mock_response
+    mocker.patch('tqdm.tqdm')
+
+
+def test_download_file_hash_success(mocker, tmp_path):
+    """Tests that a download matching the expected hash is kept, in one pass."""
+    chunks = [b"dummy", b" content"]
+    _mock_streamed_download(mocker, chunks)
+    expected_hash = hashlib.sha256(b"".join(chunks)).hexdigest()
+
+    download_path = file_operations.download_file("http://fake.url/file.zip", str(tmp_path),
+                                                  expected_hash=expected_hash.upper())
+
+    assert download_path == str(tmp_path / "file.zip")
+    assert (tmp_path / "file.zip").read_bytes() == b"dummy content"
+
+
+def test_download_file_hash_failure(mocker, tmp_path):
+    """Tests that a download with a mismatched hash is deleted and None is returned."""
+    _mock_streamed_download(mocker, [b"dummy", b" content"])
+
+    download_path = file_operations.download_file("http://fake.url/file.zip", str(tmp_path),
+                                                  expected_hash="wrong_hash")
+
+    assert download_path is None
+    assert not (tmp_path / "file.zip").exists()
+
+
+def test_download_file_rejects_truncated_body(mocker, tmp_path):
+    """Tests that a body shorter than Content-Length is deleted and None is returned."""
+    mock_response = MagicMock()
+    mock_response.headers = {'content-length': '100'}
+    mock_response.raw = io.BytesIO(b"dummy content")
+    mocker.patch('requests.get').return_value.__enter__.return_value = mock_response
+
+    download_path = file_operations.download_file("http://fake.url/file.zip", str(tmp_path))
+
+    assert download_path is None
+    assert not (tmp_path / "file.zip").exists()
+
+
+def test_download_file_converts_broken_connection(mocker, tmp_path):
+    """
+    Tests that a connection dropped while copying the raw body is raised as a
+    requests exception and the partial file is deleted.
+    """
+    mock_response = MagicMock()
+    mock_response.headers = {'content-length': '100'}
+    mock_response.raw.read.side_effect = urllib3.exceptions.ProtocolError("Connection broken: IncompleteRead")
+    mocker.patch('requests.get').return_value.__enter__.return_value = mock_response
+
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        file_operations.download_file("http://fake.url/file.zip", str(tmp_path))
+
+    assert not (tmp_path / "file.zip").exists()
 
 
 def test_verify_hash():
@@ -112,6 +180,7 @@ def test_extract_archive_uses_tarfile_for_tar_xz(mocker):
     Tests that .tar.xz archives are handled by the tarfile module with the 'data' filter.
     """
     mocker.patch('platform.system', return_value="Linux")
+    mocker.patch('shutil.which', return_value=None)  # No xz binary: use the pure-Python decoder
     mock_tarfile_context = MagicMock()
     mock_tarfile_open = mocker.patch('tarfile.open', return_value=mock_tarfile_context)
     mock_shutil_unpack = mocker.patch('shutil.unpack_archive')
@@ -126,10 +195,51 @@ def test_extract_archive_uses_tarfile_for_tar_xz(mocker):
     mock_shutil_unpack.assert_not_called()
 
 
+def test_extract_archive_uses_xz_for_tar_xz_when_available(mocker):
+    """
+    Tests that .tar.xz archives are decompressed by xz -T0 and still unpacked
+    by tarfile with the 'data' filter.
+    """
+    mocker.patch('platform.system', return_value="Linux")
+    mocker.patch('shutil.which', return_value="/usr/bin/xz")
+    mock_popen = mocker.patch('subprocess.Popen')
+    mock_popen.return_value.__enter__.return_value.returncode = 0
+    mock_popen.return_value.returncode = 0
+    mock_tarfile_context = MagicMock()
+    mock_tarfile_open = mocker.patch('tarfile.open', return_value=mock_tarfile_context)
+
+    file_operations.extract_archive("/tmp/archive.tar.xz", "/tmp/extract_to")
+
+    mock_popen.assert_called_once_with(["/usr/bin/xz", "-dc", "-T0", "/tmp/archive.tar.xz"],
+                                       stdout=subprocess.PIPE)
+    mock_tarfile_open.assert_called_once_with(fileobj=mock_popen.return_value.__enter__.return_value.stdout,
+                                              mode='r|')
+    mock_tarfile_context.__enter__().extractall.assert_called_once_with(path="/tmp/extract_to", filter='data')
+
+
+@pytest.mark.skipif(shutil.which('xz') is None, reason="xz is not installed")
+def test_extract_archive_with_xz_round_trip(tmp_path):
+    """Tests a real .tar.xz extraction through the xz pipe."""
+    source_dir = tmp_path / "blender-4.5.0-linux-x64"
+    source_dir.mkdir()
+    (source_dir / "blender").write_bytes(b"#!/bin/sh\n")
+    archive_path = tmp_path / "blender-4.5.0-linux-x64.tar.xz"
+    with tarfile.open(archive_path, 'w:xz') as tar:
+        tar.add(source_dir, arcname=source_dir.name)
+    extract_to = tmp_path / "extracted"
+    extract_to.mkdir()
+
+    extracted_path = file_operations.extract_archive(str(archive_path), str(extract_to))
+
+    assert extracted_path == str(extract_to / "blender-4.5.0-linux-x64")
+    assert (extract_to / "blender-4.5.0-linux-x64" / "blender").read_bytes() == b"#!/bin/sh\n"
+
+
 def test_cleanup_archive(mocker):
     """Tests that the cleanup function calls os.remove."""
     mock_remove = mocker.patch('os.remove')
 
     file_operations.cleanup_archive("/tmp/archive.zip")
 
-    mock_remove.assert_called_once_with("/tmp/archive.zip")
\ No newline at end of file
+    mock_remove.assert_called_once_with("/tmp/archive.zip")
+
@@ -9,9 +9,10 @@
 #
 import pytest
 import requests
-from unittest.mock import MagicMock
+import responses
 
 # Import the function to be tested
+from sethlans_worker_agent.utils import hash_parser
 from sethlans_worker_agent.utils.hash_parser import get_all_hashes_from_url
 
 DUMMY_HASH_CONTENT = """
@@ -19,34 +20,97 @@ hash_abc123  file-one.zip
 hash_def456  file-two.tar.xz
 """
 
-def test_get_all_hashes_from_url_success(mocker):
+HASHES_URL = "http://fake.url/hashes.sha256"
+MALFORMED_URL = "http://fake.url/malformed.sha256"
+UNREACHABLE_URL = "http://fake.url/unreachable.sha256"
+BINARY_MODE_URL = "http://fake.url/binary.sha256"
+
+
+@pytest.fixture(scope="module")
+def _mock_hash_server():
+    """Serves the canned hash files at the transport adapter level for the whole module."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.get(HASHES_URL, body=DUMMY_HASH_CONTENT)
+        rsps.get(MALFORMED_URL, body="  hash_abc123  file-one.zip \r\nnot-a-pair\r\nhash_x file-x.zip extra\r\n")
+        rsps.get(BINARY_MODE_URL, body="hash_abc123 *file-one.zip\n")
+        rsps.get(UNREACHABLE_URL, body=requests.exceptions.ConnectionError())
+        yield rsps
+
+
+@pytest.fixture(autouse=True)
+def mock_hash_server(_mock_hash_server):
+    """Gives each test an empty hash file cache and a clean request log."""
+    hash_parser._fetch_hashes.cache_clear()
+    _mock_hash_server.calls.reset()
+    yield _mock_hash_server
+    hash_parser._fetch_hashes.cache_clear()
+
+
+def test_get_all_hashes_from_url_success(mock_hash_server):
     """
     Tests that the hash parser correctly fetches and parses a SHA256 file.
     """
-    # Arrange: Mock the requests.get call
-    mock_response = MagicMock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.text = DUMMY_HASH_CONTENT
-    mocker.patch('requests.get', return_value=mock_response)
-
     # Act
-    hashes = get_all_hashes_from_url("http://fake.url/hashes.sha256")
+    hashes = get_all_hashes_from_url(HASHES_URL)
 
     # Assert
     assert len(hashes) == 2
     assert hashes["file-one.zip"] == "hash_abc123"
     assert hashes["file-two.tar.xz"] == "hash_def456"
-    requests.get.assert_called_once_with("http://fake.url/hashes.sha256", timeout=5)
+    assert len(mock_hash_server.calls) == 1
+    assert mock_hash_server.calls[0].request.req_kwargs["timeout"] == 5
 
-def test_get_all_hashes_from_url_network_error(mocker):
+def test_get_all_hashes_from_url_network_error():
     """
     Tests that an empty dictionary is returned if a network error occurs.
     """
-    # Arrange: Mock requests.get to raise an exception
-    mocker.patch('requests.get', side_effect=requests.exceptions.RequestException)
-
     # Act
-    hashes = get_all_hashes_from_url("http://fake.url/hashes.sha256")
+    hashes = get_all_hashes_from_url(UNREACHABLE_URL)
 
     # Assert
-    assert hashes == {}
\ No newline at end of file
+    assert hashes == {}
+
+def test_get_all_hashes_from_url_skips_malformed_lines():
+    """
+    Tests that lines without exactly a hash and a filename are ignored,
+    including CRLF line endings and surrounding whitespace.
+    """
+    hashes = get_all_hashes_from_url(MALFORMED_URL)
+
+    assert hashes == {"file-one.zip": "hash_abc123"}
+
+
+def test_get_all_hashes_from_url_strips_binary_mode_marker():
+    """
+    Tests that the `*` binary-mode prefix written by sha256sum is not part of the filename.
+    """
+    hashes = get_all_hashes_from_url(BINARY_MODE_URL)
+
+    assert hashes == {"file-one.zip": "hash_abc123"}
+
+
+def test_get_all_hashes_from_url_fetches_each_file_once(mock_hash_server):
+    """
+    Tests that repeated lookups of the same hash file reuse the cached parse
+    while still returning independent dictionaries.
+    """
+    first = get_all_hashes_from_url(HASHES_URL)
+    second = get_all_hashes_from_url(HASHES_URL)
+
+    assert first == second
+    assert first is not second
+    assert len(mock_hash_server.calls) == 1
+
+
+def test_get_all_hashes_from_url_uses_given_session(mocker, mock_hash_server):
+    """
+    Tests that a caller's session is used for the request, so the scraper's
+    pooled connection is reused for hash files.
+    """
+    session = requests.Session()
+    spy_get = mocker.spy(session, 'get')
+
+    hashes = get_all_hashes_from_url(HASHES_URL, session)
+
+    assert hashes["file-one.zip"] == "hash_abc123"
+    spy_get.assert_called_once_with(HASHES_URL, timeout=5)
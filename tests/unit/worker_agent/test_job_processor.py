@@ -39,14 +39,20 @@ def reset_job_processor_state():
 
 
 @pytest.mark.parametrize("stdout, expected_seconds", [
-    (VALID_STDOUT_SUB_SECOND, 1),
-    (VALID_STDOUT_UNDER_AN_HOUR, 96),
-    (VALID_STDOUT_OVER_AN_HOUR, 3724),
-    ("Some other text...\nTime: 01:02:03.99 (Saving: 00:00.00)", 3724),
-    ("Another line...\nTime: 12.34 (Saving: 00.01)", None),
-    (NO_TIME_STDOUT, None),
-    (PROGRESS_BAR_TIME_STDOUT, None),
-    ("", None)
+    pytest.param(VALID_STDOUT_SUB_SECOND, 1, id="sub_second_rounds_up"),
+    pytest.param(VALID_STDOUT_UNDER_AN_HOUR, 96, id="mm_ss"),
+    pytest.param(VALID_STDOUT_OVER_AN_HOUR, 3724, id="hh_mm_ss"),
+    pytest.param("Some other text...\nTime: 01:02:03.99 (Saving: 00:00.00)", 3724, id="no_trailing_newline"),
+    # Animations print one summary line per frame; the final one is used.
+    pytest.param("Time: 00:05.00 (Saving: 00:00.01)\nFra:2 ...\nTime: 00:07.10 (Saving: 00:00.01)\n", 8,
+                 id="last_of_several_summaries"),
+    pytest.param("Another line...\nTime: 12.34 (Saving: 00.01)", None, id="seconds_only_rejected"),
+    pytest.param(NO_TIME_STDOUT, None, id="no_summary_line"),
+    pytest.param(PROGRESS_BAR_TIME_STDOUT, None, id="progress_bar_ignored"),
+    pytest.param(" Time: 00:01.50 (Saving: 00:00.01)\n", 2, id="leading_whitespace"),
+    pytest.param("Fra:1 | Time:00:09.53 | Remaining:00:20.23 (Saving: 00:00.01)", None,
+                 id="time_not_at_line_start"),
+    pytest.param("", None, id="empty_output"),
 ])
 def test_parse_render_time(stdout, expected_seconds):
     """Tests the _parse_render_time function with various inputs."""
@@ -62,6 +68,7 @@ def test_get_and_claim_job_dispatches_thread(mocker):
     mock_poll = mocker.patch('sethlans_worker_agent.job_processor.poll_and_claim_job')
     mock_process_func = mocker.patch('sethlans_worker_agent.job_processor.process_claimed_job')
     mock_thread = mocker.patch('threading.Thread')
+    mocker.patch.object(job_processor, '_job_threads', [])
     worker_id = 99
 
     # Case 1: A job is found and claimed
@@ -87,6 +94,20 @@ def test_get_and_claim_job_dispatches_thread(mocker):
     mock_thread.return_value.start.assert_not_called()
 
 
+def test_has_active_jobs_tracks_dispatched_threads(mocker):
+    """Tests that only still-running job threads count as active."""
+    running, finished = MagicMock(), MagicMock()
+    running.is_alive.return_value = True
+    finished.is_alive.return_value = False
+    mocker.patch.object(job_processor, '_job_threads', [running, finished])
+
+    assert job_processor.has_active_jobs() is True
+    assert job_processor._job_threads == [running]
+
+    running.is_alive.return_value = False
+    assert job_processor.has_active_jobs() is False
+
+
 # --- NEW: Test suite for process_claimed_job ---
 class TestProcessClaimedJob:
     @pytest.fixture
@@ -105,7 +126,7 @@ class TestProcessClaimedJob:
     def test_process_job_success_workflow(self, mocker, mock_process_deps):
         """
         Tests the entire successful workflow: render, upload, report DONE.
-        Also verifies that the initial status update includes the `started_at` timestamp.
+        The RENDERING status is sent with the claim, so only the final status is reported here.
         """
         mock_execute, mock_update_status, mock_upload, mock_os_remove = mock_process_deps
         mock_execute.return_value = (True, False, VALID_STDOUT_UNDER_AN_HOUR, "", "", "/mock/output/file.png")
@@ -116,15 +137,10 @@ class TestProcessClaimedJob:
 
         # Assert status updates
         update_calls = mock_update_status.call_args_list
-        assert len(update_calls) == 2
-        # --- FIX: First call sets status to RENDERING and includes started_at ---
-        initial_payload = update_calls[0].args[1]
-        assert initial_payload['status'] == 'RENDERING'
-        assert 'started_at' in initial_payload
-        assert isinstance(initial_payload['started_at'], str)
-
-        # Second call reports final status
-        final_payload = update_calls[1].args[1]
+        assert len(update_calls) == 1
+
+        # The only call reports final status
+        final_payload = update_calls[0].args[1]
         assert final_payload['status'] == 'DONE'
         assert final_payload['render_time_seconds'] == 96
 
@@ -197,6 +213,8 @@ class TestPollAndClaimJob:
         mock_poll_api.assert_called_once()
         call_params = mock_poll_api.call_args.args[0]
         assert 'gpu_available' not in call_params
+        # Only one job is ever claimed per poll, so only one is requested.
+        assert call_params['limit'] == '1'
 
     def test_get_next_available_gpu(self, mocker):
         """Tests the logic for finding the next free GPU index."""
@@ -328,4 +346,6 @@ class TestPollAndClaimJob:
         assert result is not None
         assert result['id'] == 1
         assert result['name'] == 'Claim Me'
-        mock_claim_job_api.assert_called_once_with(1, 1)
\ No newline at end of file
+        mock_claim_job_api.assert_called_once_with(1, 1, started_at=mocker.ANY)
+        # The claim also starts the job, carrying the started_at timestamp.
+        assert mock_claim_job_api.call_args.kwargs['started_at'].endswith('Z')
\ No newline at end of file
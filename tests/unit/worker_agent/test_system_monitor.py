@@ -129,14 +129,14 @@ def test_register_with_manager_lts_success(mocker):
         tool_manager_instance, 'ensure_blender_version_available', return_value="/path/to/blender-4.5.1"
     )
     mocker.patch('sethlans_worker_agent.system_monitor.get_system_info', return_value={})
-    mock_post = mocker.patch('requests.post')
+    mock_post = mocker.patch('sethlans_worker_agent.api_handler.post_heartbeat')
     mock_post.return_value.json.return_value = {'id': 123}
 
     worker_id = system_monitor.register_with_manager()
 
     assert worker_id == 123
     mock_ensure_blender.assert_called_once_with('4.5.1')
-    mock_post.assert_called_once()
+    mock_post.assert_called_once_with({}, timeout=10)
 
 
 def test_register_with_manager_lts_not_found(mocker):
@@ -160,11 +160,11 @@ def test_send_heartbeat_success(mocker):
     Tests that a heartbeat is sent correctly when the worker is registered.
     """
     mocker.patch.object(system_monitor, 'WORKER_ID', 123)
-    mock_post = mocker.patch('requests.post')
+    mock_post = mocker.patch('sethlans_worker_agent.api_handler.post_heartbeat')
 
     system_monitor.send_heartbeat()
 
-    mock_post.assert_called_once()
+    mock_post.assert_called_once_with({"hostname": system_monitor.HOSTNAME})
 
 
 def test_get_gpu_device_details_success(mocker):
@@ -144,13 +144,13 @@ def test_get_blender_download_info_from_parser(mocker):
 @pytest.fixture
 def mock_ensure_deps(mocker):
     """Fixture to mock all dependencies for ensure_blender_version_available."""
+    mocker.patch.dict(tool_manager_instance._resolved_paths, clear=True)
     mocker.patch.object(tool_manager_instance, '_create_tools_directory_if_not_exists')
     mocker.patch.object(tool_manager_instance, '_resolve_version', side_effect=lambda v: v) # Pass through by default
     mock_get_exe = mocker.patch.object(tool_manager_instance, 'get_blender_executable_path')
     mock_get_info = mocker.patch.object(tool_manager_instance, '_get_blender_download_info')
 
     mock_download = mocker.patch.object(file_operations, 'download_file')
-    mock_verify = mocker.patch.object(file_operations, 'verify_hash')
     mock_extract = mocker.patch.object(file_operations, 'extract_archive')
     mock_cleanup = mocker.patch.object(file_operations, 'cleanup_archive')
 
@@ -158,7 +158,7 @@ def mock_ensure_deps(mocker):
 
     return {
         "get_exe": mock_get_exe, "get_info": mock_get_info, "download": mock_download,
-        "verify": mock_verify, "extract": mock_extract, "cleanup": mock_cleanup
+        "extract": mock_extract, "cleanup": mock_cleanup
     }
 
 
@@ -172,6 +172,19 @@ def test_ensure_blender_already_exists(mock_ensure_deps):
     mock_ensure_deps["get_info"].assert_not_called()
 
 
+def test_ensure_blender_reuses_resolved_path(mock_ensure_deps, mocker):
+    """Tests that a resolved executable is returned from cache while it still exists."""
+    mocker.patch('os.path.isfile', return_value=True)
+    mock_ensure_deps["get_exe"].return_value = "/path/to/blender.exe"
+
+    first = tool_manager_instance.ensure_blender_version_available("4.5")
+    second = tool_manager_instance.ensure_blender_version_available("4.5")
+
+    assert first == second == "/path/to/blender.exe"
+    tool_manager_instance._resolve_version.assert_called_once_with("4.5")
+    mock_ensure_deps["get_exe"].assert_called_once()
+
+
 def test_ensure_blender_download_success(mock_ensure_deps, mocker):
     """Tests the full successful download, verify, and extract workflow."""
     mocker.patch('platform.system', return_value="Linux")
@@ -186,12 +199,11 @@ def test_ensure_blender_download_success(mock_ensure_deps, mocker):
         "4.1.1": {"linux-x64": {"url": "http://a.tar.xz", "sha256": "hash123"}}
     }
     mock_ensure_deps["download"].return_value = "/tmp/a.tar.xz"
-    mock_ensure_deps["verify"].return_value = True
 
     result = tool_manager_instance.ensure_blender_version_available("4.1.1")
 
     assert result == "/path/to/blender.exe"
-    mock_ensure_deps["download"].assert_called_once_with("http://a.tar.xz", mocker.ANY)
+    mock_ensure_deps["download"].assert_called_once_with("http://a.tar.xz", mocker.ANY, expected_hash="hash123")
     mock_chmod.assert_called_once()
     mock_ensure_deps["cleanup"].assert_called_once()
 
@@ -209,21 +221,33 @@ def test_ensure_blender_version_not_in_releases(mock_ensure_deps, mocker):
 
 
 def test_ensure_blender_hash_verification_fails(mock_ensure_deps, mocker):
-    """Tests that a failed hash check aborts the process and cleans up."""
+    """Tests that a failed hash check (download_file returns None) aborts the process."""
     mocker.patch.object(tool_manager_instance, '_resolve_version', return_value="4.1.1")
     mock_ensure_deps["get_exe"].return_value = None
     mock_ensure_deps["get_info"].return_value = {
         "4.1.1": {"windows-x64": {"url": "http://a.zip", "sha256": "hash123"}}
     }
-    mock_ensure_deps["download"].return_value = "/tmp/a.zip"
-    mock_ensure_deps["verify"].return_value = False
-    mock_remove = mocker.patch('os.remove')
+    mock_ensure_deps["download"].return_value = None
 
     result = tool_manager_instance.ensure_blender_version_available("4.1.1")
 
     assert result is None
-    mock_remove.assert_called_once_with("/tmp/a.zip")
     mock_ensure_deps["extract"].assert_not_called()
+    mock_ensure_deps["cleanup"].assert_not_called()
+
+
+def test_ensure_blender_missing_hash_skips_download(mock_ensure_deps, mocker):
+    """Tests that a release without a published hash is never downloaded."""
+    mocker.patch.object(tool_manager_instance, '_resolve_version', return_value="4.1.1")
+    mock_ensure_deps["get_exe"].return_value = None
+    mock_ensure_deps["get_info"].return_value = {
+        "4.1.1": {"windows-x64": {"url": "http://a.zip", "sha256": None}}
+    }
+
+    result = tool_manager_instance.ensure_blender_version_available("4.1.1")
+
+    assert result is None
+    mock_ensure_deps["download"].assert_not_called()
 
 
 @pytest.mark.parametrize("system, machine, expected_id", [
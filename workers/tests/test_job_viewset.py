@@ -207,4 +207,14 @@ class JobViewSetTests(BaseMediaTestCase):
         # Should only get the 3 jobs from the active project created in setUp
         self.assertEqual(len(response.data), 3)
         names = {job['name'] for job in response.data}
-        self.assertNotIn("Paused Job", names)
\ No newline at end of file
+        self.assertNotIn("Paused Job", names)
+
+    def test_worker_poll_honors_limit(self):
+        """
+        Tests that a worker poll with `limit` returns at most that many jobs.
+        """
+        params = {'status': 'QUEUED', 'assigned_worker__isnull': 'true', 'limit': '1'}
+        response = self.client.get(self.url, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
\ No newline at end of file
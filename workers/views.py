@@ -374,6 +374,20 @@ class JobViewSet(viewsets.ModelViewSet):
 
         return queryset
 
+    def filter_queryset(self, queryset):
+        """
+        Applies the standard filters, then caps a job listing at `limit` results.
+
+        Workers only claim the first job of a poll, so they pass `limit=1`
+        rather than downloading every queued job. The cap is applied last
+        because a sliced queryset cannot be filtered any further.
+        """
+        queryset = super().filter_queryset(queryset)
+        limit = self.request.query_params.get('limit', '')
+        if self.action == 'list' and limit.isdigit() and int(limit) > 0:
+            return queryset[:int(limit)]
+        return queryset
+
     @action(detail=True, methods=['post'])
     def cancel(self, request, pk=None):
         """